@@ -3,7 +3,6 @@ import sys
 from PyQt6.QtWidgets import QApplication
 
 from mcr_analyzer.config.qt import q_settings__setup
-from mcr_analyzer.ui.main_window import MainWindow
 
 
 def main() -> None:
@@ -11,10 +10,19 @@ def main() -> None:
 
     q_settings__setup(app)
 
+    # - The user interface pulls in NumPy, OpenCV and SQLAlchemy. Importing it only here lets the
+    #   application object, and with it the platform integration, come up before that import cost is paid.
+    from mcr_analyzer.database.database import database  # noqa: PLC0415
+    from mcr_analyzer.ui.main_window import MainWindow  # noqa: PLC0415
+
     main_window = MainWindow()
     main_window.show()
 
-    sys.exit(app.exec())
+    exit_code = app.exec()
+
+    database.close()
+
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
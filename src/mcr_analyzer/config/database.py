@@ -4,3 +4,15 @@ SQLITE__DRIVER_NAME: Final[str] = "sqlite"
 SQLITE__FILENAME_EXTENSION: Final[str] = f".{SQLITE__DRIVER_NAME}"
 
 SQLITE__FILE_FILTER: Final[str] = f"SQLite Database (*{SQLITE__FILENAME_EXTENSION})"
+
+# - https://www.sqlite.org/pragma.html
+#   - `journal_mode=WAL` with `synchronous=NORMAL` avoids an fsync per commit.
+#   - `cache_size` is negative to be given in KiB, i.e. 64 MiB.
+#   - `mmap_size` lets reads of the image blobs bypass `read()` syscalls, i.e. 256 MiB.
+SQLITE__PRAGMA_LIST: Final[tuple[str, ...]] = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "cache_size=-64000",
+    "mmap_size=268435456",
+)
@@ -1,3 +1,19 @@
-from typing import Final
+import hashlib
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from _typeshed import ReadableBuffer  # cSpell:ignore typeshed
 
 HASH__DIGEST_SIZE: Final[int] = 32
+
+
+def get_hash_digest(data: "ReadableBuffer") -> bytes:
+    # - Hash the whole contiguous buffer in one call: hashlib then releases the GIL and hands the buffer to OpenSSL,
+    #   which uses the SHA extensions of the CPU where available.
+    hash_object = hashlib.sha256(data)
+
+    if hash_object.digest_size != HASH__DIGEST_SIZE:
+        msg = f"invalid hash digest size: {hash_object.digest_size} (expected: {HASH__DIGEST_SIZE})"
+        raise ValueError(msg)
+
+    return hash_object.digest()
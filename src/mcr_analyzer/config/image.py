@@ -8,8 +8,6 @@ import numpy.typing as npt
 from PyQt6.QtCore import QLineF, QPointF
 from returns.pipeline import is_successful
 from returns.result import Failure, Result, Success
-from scipy.ndimage import maximum_filter  # cSpell:ignore ndimage
-from scipy.stats import mode
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Iterator, Sequence
@@ -53,6 +51,9 @@ OPEN_CV__IMAGE__ND_ARRAY__DATA_TYPE: Final[TypeAlias] = npt.NDArray[OPEN_CV__IMA
 OPEN_CV__IMAGE__BRIGHTNESS__MIN: Final[int] = -np.iinfo(OPEN_CV__IMAGE__DATA_TYPE).max // 2
 OPEN_CV__IMAGE__BRIGHTNESS__MAX: Final[int] = -OPEN_CV__IMAGE__BRIGHTNESS__MIN - 1
 
+# - Number of recently selected measurements whose decoded and normalized images are kept in memory
+IMAGE__CACHE__MAX_LENGTH: Final[int] = 16
+
 OPEN_CV__CONTOUR__DATA_TYPE: Final[TypeAlias] = npt.NDArray[np.int32]
 
 FOURIER_TRANSFORM__IMAGE__DATA_TYPE: Final[TypeAlias] = np.complex128
@@ -155,6 +156,9 @@ def try_to_analyze_image_with_fourier_transform(
     )
     frequency = min(frequency_row, frequency_column)
 
+    # - SciPy is only needed for the automatic grid adjustment, so its import cost is not paid at application startup.
+    from scipy.ndimage import maximum_filter  # noqa: PLC0415 # cSpell:ignore ndimage
+
     size_upper_bound_learned_by_experience = 6
     for i in range(1, min(size_upper_bound_learned_by_experience, frequency)):
         analyze_image_with_fourier_transform_result = analyze_image_with_fourier_transform(
@@ -563,6 +567,9 @@ def draw_circle_on_image_like(
 
 
 def get_image_foreground_and_background_color(image: OPEN_CV__IMAGE__ND_ARRAY__DATA_TYPE) -> tuple[int, int]:
+    # - `scipy.stats` alone takes a large share of the application import time.
+    from scipy.stats import mode  # noqa: PLC0415
+
     background_color = round(mode(a=image, axis=None).mode)
     foreground_color = OPEN_CV__IMAGE__DATA_TYPE__MAX - background_color
 
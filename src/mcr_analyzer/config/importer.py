@@ -1,3 +1,8 @@
 from typing import Final
 
 IMPORTER__COLUMN_INDEX__STATUS: Final[int] = 3
+IMPORTER__STATUS__IMPORTED_PREVIOUSLY: Final[str] = "Imported previously"
+IMPORTER__STATUS__IMPORT_SUCCESSFUL: Final[str] = "Import successful"
+IMPORTER__STATUS__IMPORT_FAILED: Final[str] = "Import failed"
+
+IMPORTER__COMMIT__BATCH_SIZE: Final[int] = 32
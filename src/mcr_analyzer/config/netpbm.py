@@ -1,3 +1,4 @@
+import re
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Final, TypeAlias
@@ -9,7 +10,7 @@ from returns.result import Failure, Result, Success
 
 from mcr_analyzer.utils.re import re_match
 
-NETPBM_MAGIC_NUMBER__PATTERN: Final[str] = "P[1-6]"
+NETPBM_MAGIC_NUMBER__PATTERN: Final[re.Pattern[str]] = re.compile(r"P[1-6]")
 
 PGM__COLOR_BIT_DEPTH: Final[int] = 16
 PGM__COLOR_RANGE_MIN: Final[int] = 0
@@ -18,6 +19,9 @@ PGM__COLOR_RANGE_MAX: Final[int] = 2**PGM__COLOR_BIT_DEPTH - 1
 PGM__IMAGE__DATA_TYPE: Final[TypeAlias] = np.uint16
 PGM__IMAGE__ND_ARRAY__DATA_TYPE: Final[TypeAlias] = npt.NDArray[PGM__IMAGE__DATA_TYPE]
 
+# - Big-endian unsigned 16-bit integer, the sample layout of the raw (binary) PGM format.
+PGM__IMAGE__BINARY_RAW__DATA_TYPE: Final[np.dtype[PGM__IMAGE__DATA_TYPE]] = np.dtype(">u2")
+
 
 PGM__HEIGHT: Final[int] = 520
 PGM__WIDTH: Final[int] = 696
@@ -26,6 +30,9 @@ PGM__SHAPE: Final[tuple[int, int]] = (PGM__HEIGHT, PGM__WIDTH)
 PGM__HEIGHT__PATTERN: Final[str] = str(PGM__HEIGHT)
 PGM__WIDTH__PATTERN: Final[str] = str(PGM__WIDTH)
 
+PGM__WIDTH_HEIGHT__PATTERN: Final[re.Pattern[str]] = re.compile(f"({PGM__WIDTH__PATTERN}) ({PGM__HEIGHT__PATTERN})")
+PGM__COLOR_RANGE_MAX__PATTERN: Final[re.Pattern[str]] = re.compile(str(PGM__COLOR_RANGE_MAX))
+
 
 @dataclass(frozen=True)
 class NetpbmMagicNumber:  # cSpell:ignore Netpbm
@@ -54,6 +61,9 @@ def parse_netpbm_magic_number(*, string: str) -> Result[NetpbmMagicNumber, str]:
         case "P2":
             type = NetpbmMagicNumber.Type.pgm
             encoding = NetpbmMagicNumber.Encoding.ascii_plain
+        case "P5":
+            type = NetpbmMagicNumber.Type.pgm
+            encoding = NetpbmMagicNumber.Encoding.binary_raw
         case _:
             return Failure(f"not supported: NetpbmMagicNumber = {netpbm_magic_number}")
 
@@ -19,20 +19,26 @@ def q_settings__setup(app: "QApplication") -> None:
     app.setApplicationName("MCR-Analyzer")
 
 
-def q_settings__session__recent_file_name_list__get() -> list[str]:
-    recent_file_name_list: list[str] | None = QSettings().value(
+def q_settings__session__recent_file_name_list__get(q_settings: QSettings | None = None) -> list[str]:
+    if q_settings is None:
+        q_settings = QSettings()
+
+    recent_file_name_list: list[str] | None = q_settings.value(
         Q_SETTINGS__SESSION__RECENT_FILE_NAME_LIST, defaultValue=[]
     )
 
     if recent_file_name_list is None:
         recent_file_name_list = []
-        QSettings().setValue(Q_SETTINGS__SESSION__RECENT_FILE_NAME_LIST, recent_file_name_list)
+        q_settings.setValue(Q_SETTINGS__SESSION__RECENT_FILE_NAME_LIST, recent_file_name_list)
 
     return recent_file_name_list
 
 
 def q_settings__session__recent_file_name_list__add(file_name: str) -> None:
-    recent_file_name_list = q_settings__session__recent_file_name_list__get()
+    q_settings = QSettings()
+
+    recent_file_name_list = q_settings__session__recent_file_name_list__get(q_settings)
+    recent_file_name_list_current = recent_file_name_list.copy()
 
     list_remove_if_exist(recent_file_name_list, file_name)
 
@@ -40,11 +46,16 @@ def q_settings__session__recent_file_name_list__add(file_name: str) -> None:
 
     recent_file_name_list = recent_file_name_list[:Q_SETTINGS__SESSION__RECENT_FILE_NAME_LIST__MAX_LENGTH]
 
-    QSettings().setValue(Q_SETTINGS__SESSION__RECENT_FILE_NAME_LIST, recent_file_name_list)
+    # - Every write goes to the settings storage (e.g. the registry on Windows), so an unchanged list is not written.
+    if recent_file_name_list != recent_file_name_list_current:
+        q_settings.setValue(Q_SETTINGS__SESSION__RECENT_FILE_NAME_LIST, recent_file_name_list)
 
 
 def q_settings__session__recent_file_name_list__remove(file_name_or_file_name_list: str | list[str]) -> None:
-    recent_file_name_list = q_settings__session__recent_file_name_list__get()
+    q_settings = QSettings()
+
+    recent_file_name_list = q_settings__session__recent_file_name_list__get(q_settings)
+    recent_file_name_list_length = len(recent_file_name_list)
 
     file_name_list = (
         [file_name_or_file_name_list] if isinstance(file_name_or_file_name_list, str) else file_name_or_file_name_list
@@ -53,7 +64,8 @@ def q_settings__session__recent_file_name_list__remove(file_name_or_file_name_li
     for file_name in file_name_list:
         list_remove_if_exist(recent_file_name_list, file_name)
 
-    QSettings().setValue(Q_SETTINGS__SESSION__RECENT_FILE_NAME_LIST, recent_file_name_list)
+    if len(recent_file_name_list) != recent_file_name_list_length:
+        q_settings.setValue(Q_SETTINGS__SESSION__RECENT_FILE_NAME_LIST, recent_file_name_list)
 
 
 _MAIN_WINDOW__SIZE_HINT__WIDTH: Final[int] = 1700
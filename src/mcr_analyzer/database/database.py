@@ -1,20 +1,30 @@
 """Database routines for setup and usage."""
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from returns.pipeline import is_successful
 from returns.result import Failure, Result, Success
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine import URL, Engine
-from sqlalchemy.exc import OperationalError
-from sqlalchemy.orm import Session, sessionmaker  # cSpell:ignore sessionmaker
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.orm import (  # cSpell:ignore sessionmaker raiseload
+    ORMExecuteState,
+    Session,
+    raiseload,
+    scoped_session,
+    sessionmaker,
+)
+from sqlalchemy.pool import Pool, QueuePool, StaticPool
 from sqlalchemy.sql.expression import select
 
-from mcr_analyzer.config.database import SQLITE__DRIVER_NAME
+from mcr_analyzer.config.database import SQLITE__DRIVER_NAME, SQLITE__PRAGMA_LIST
 from mcr_analyzer.database.models import Base
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from sqlalchemy.engine.interfaces import DBAPIConnection
+
 
 def make_url__sqlite(sqlite_file_path: "Path | None" = None) -> URL:
     """Given a `Path` or `None`, produce a new sqlite `URL` instance.
@@ -35,17 +45,39 @@ def make_url__sqlite(sqlite_file_path: "Path | None" = None) -> URL:
 
 
 def create_engine__sqlite(sqlite_file_path: "Path | None" = None) -> Engine:
-    return create_engine(url=make_url__sqlite(sqlite_file_path))
+    # - The in-memory database only lives as long as its connection, so every session has to share the one connection.
+    #   A file database keeps a queue of long-lived connections instead of reopening the file per session.
+    poolclass: type[Pool] = StaticPool if sqlite_file_path is None else QueuePool  # cSpell:ignore poolclass
+
+    # - Pooled connections may be handed to a thread other than the one which opened them.
+    engine = create_engine(
+        url=make_url__sqlite(sqlite_file_path), poolclass=poolclass, connect_args={"check_same_thread": False}
+    )
+
+    event.listen(engine, "connect", _set_sqlite_pragma)
+
+    return engine
+
+
+def _set_sqlite_pragma(dbapi_connection: "DBAPIConnection", _connection_record: Any) -> None:
+    cursor = dbapi_connection.cursor()
+
+    for pragma in SQLITE__PRAGMA_LIST:
+        cursor.execute(f"PRAGMA {pragma}")
+
+    cursor.close()
 
 
 class _DatabaseSingleton:
-    Session: sessionmaker[Session]
+    Session: scoped_session[Session]
 
     def __new__(cls) -> "_DatabaseSingleton":
         if not hasattr(cls, "_singleton_instance"):
             cls._singleton_instance = super().__new__(cls)
 
-            cls._singleton_instance.Session = sessionmaker()
+            # - Each thread reuses its own session instead of building a new one per call, and objects stay readable
+            #   after commit without a reload `SELECT` per expired attribute.
+            cls._singleton_instance.Session = scoped_session(sessionmaker(expire_on_commit=False))
 
         return cls._singleton_instance
 
@@ -55,14 +87,26 @@ class _DatabaseSingleton:
     def load__sqlite(self, sqlite_file_path: "Path | None" = None) -> Result[Engine, str]:
         engine = create_engine__sqlite(sqlite_file_path)
 
+        # - A rejected engine is disposed right away, so that it does not keep a pooled connection to the file open.
         if not _is_engine_compatible_with_base(engine, Base):
+            engine.dispose()
             return Failure("Engine is incompatible with Base.")
 
-        self.Session.configure(bind=engine)
+        create_indexes_result = _create_indexes_if_not_exist(engine, Base)
+        if not is_successful(create_indexes_result):
+            engine.dispose()
+            return Failure(create_indexes_result.failure())
+
+        self._dispose_engine()
+        self._set_engine(engine)
 
         return Success(engine)
 
     def create_and_load__sqlite(self, sqlite_file_path: "Path | None" = None) -> None:
+        # - Release the connections to the previous database first, which checkpoints its WAL file, in case the same
+        #   file is about to be overwritten.
+        self._dispose_engine()
+
         if sqlite_file_path is not None:
             # - Create an empty file.
             sqlite_file_path.open(mode="w").close()
@@ -71,8 +115,41 @@ class _DatabaseSingleton:
 
         Base.metadata.create_all(bind=engine, checkfirst=False)  # cSpell:ignore checkfirst
 
+        self._set_engine(engine)
+
+    def enable_strict_loading(self) -> None:
+        """Make any implicit lazy load of a relationship raise instead of emitting a query.
+
+        Meant for development and tests to catch N+1 query patterns. Queries then have to list their relationship
+        loading explicitly, e.g. with `selectinload(...)` or `joinedload(...)`.
+        """
+        session_factory = self.Session.session_factory
+
+        if not event.contains(session_factory, "do_orm_execute", _add_raiseload_option):
+            event.listen(session_factory, "do_orm_execute", _add_raiseload_option)
+
+    def disable_strict_loading(self) -> None:
+        session_factory = self.Session.session_factory
+
+        if event.contains(session_factory, "do_orm_execute", _add_raiseload_option):
+            event.remove(session_factory, "do_orm_execute", _add_raiseload_option)
+
+    def close(self) -> None:
+        """Close the current session and all pooled connections, so that SQLite checkpoints and removes its WAL file."""
+        self.Session.remove()
+        self._dispose_engine()
+
+    def _set_engine(self, engine: Engine) -> None:
+        # - `configure` only affects sessions created afterwards, so the current thread-local session is discarded.
+        self.Session.remove()
         self.Session.configure(bind=engine)
 
+    def _dispose_engine(self) -> None:
+        engine = self.Session.session_factory.kw.get("bind")
+
+        if isinstance(engine, Engine):
+            engine.dispose()
+
     @property
     def is_valid(self) -> bool:
         with self.Session() as session:
@@ -82,6 +159,11 @@ class _DatabaseSingleton:
 database = _DatabaseSingleton()
 
 
+def _add_raiseload_option(orm_execute_state: ORMExecuteState) -> None:
+    if orm_execute_state.is_select and not orm_execute_state.is_relationship_load:
+        orm_execute_state.statement = orm_execute_state.statement.options(raiseload("*"))
+
+
 def _is_engine_compatible_with_base(engine: Engine, base: type[Base]) -> bool:
     try:
         with Session(bind=engine) as session:
@@ -92,3 +174,21 @@ def _is_engine_compatible_with_base(engine: Engine, base: type[Base]) -> bool:
         return False
 
     return True
+
+
+def _create_indexes_if_not_exist(engine: Engine, base: type[Base]) -> Result[None, str]:
+    """Add the indexes of the models which are missing in a database created by an earlier version.
+
+    The importer relies on the unique index of `Measurement.image_hash` to skip images imported before, which databases
+    created before the column was unique do not have.
+    """
+    try:
+        with engine.begin() as connection:
+            for table in base.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(bind=connection, checkfirst=True)  # cSpell:ignore checkfirst
+
+    except IntegrityError:
+        return Failure("Database contains multiple measurements of the same image.")
+
+    return Success(None)
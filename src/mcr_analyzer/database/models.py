@@ -24,10 +24,11 @@ class Measurement(Base):
     probe_id: Mapped[str]
     chip_id: Mapped[str]
 
-    image_data: Mapped[bytes]
     image_height: Mapped[int]
     image_width: Mapped[int]
-    image_hash: Mapped[bytes] = mapped_column(BINARY(HASH__DIGEST_SIZE))
+    # - A named unique index instead of an inline `UNIQUE` constraint, so that it can be added to databases created
+    #   before the column was unique, see `_create_indexes_if_not_exist`.
+    image_hash: Mapped[bytes] = mapped_column(BINARY(HASH__DIGEST_SIZE), index=True, unique=True)
 
     row_count: Mapped[int]
     column_count: Mapped[int]
@@ -47,10 +48,17 @@ class Measurement(Base):
 
     notes: Mapped[str]
 
+    # - The raw image is by far the widest column, so it is only fetched on access or when undeferred explicitly.
+    # - It is the last column of the table: SQLite stores a large value in a chain of overflow pages, which has to be
+    #   walked to reach any column stored after it.
+    image_data: Mapped[bytes] = mapped_column(deferred=True)
+
     groups: Mapped[list["Group"]] = relationship(back_populates="measurement", default_factory=list)
 
 
-column_type__foreign_key__measurement = Annotated[int, mapped_column(ForeignKey(f"{Measurement.__tablename__}.id"))]
+column_type__foreign_key__measurement = Annotated[
+    int, mapped_column(ForeignKey(f"{Measurement.__tablename__}.id"), index=True)
+]
 
 
 class Group(Base):
@@ -61,10 +69,11 @@ class Group(Base):
     notes: Mapped[str]
     color_code_hex_rgb: Mapped[str]
 
-    spots: Mapped[list["Spot"]] = relationship(back_populates="group", default_factory=list)
+    # - A group is never used without its spots, so load them for all groups of a query in one `SELECT ... IN`.
+    spots: Mapped[list["Spot"]] = relationship(back_populates="group", default_factory=list, lazy="selectin")
 
 
-column_type__foreign_key__group = Annotated[int, mapped_column(ForeignKey(f"{Group.__tablename__}.id"))]
+column_type__foreign_key__group = Annotated[int, mapped_column(ForeignKey(f"{Group.__tablename__}.id"), index=True)]
 
 
 class Spot(Base):
@@ -6,11 +6,11 @@ from returns.pipeline import is_successful
 from returns.result import Failure, Result, Success
 
 from mcr_analyzer.config.netpbm import (  # cSpell:ignore netpbm
-    PGM__COLOR_RANGE_MAX,
-    PGM__HEIGHT__PATTERN,
+    PGM__COLOR_RANGE_MAX__PATTERN,
+    PGM__IMAGE__BINARY_RAW__DATA_TYPE,
     PGM__IMAGE__DATA_TYPE,
     PGM__IMAGE__ND_ARRAY__DATA_TYPE,
-    PGM__WIDTH__PATTERN,
+    PGM__WIDTH_HEIGHT__PATTERN,
     NetpbmMagicNumber,
     parse_netpbm_magic_number,
 )
@@ -18,7 +18,7 @@ from mcr_analyzer.utils.io import readlines
 from mcr_analyzer.utils.re import is_re_match_successful, re_match
 
 if TYPE_CHECKING:
-    from io import TextIOWrapper
+    from io import BufferedReader
     from pathlib import Path
 
 
@@ -28,25 +28,36 @@ class ImageFormat(Enum):
 
 
 def parse_image(*, file_path: "Path") -> Result[tuple[PGM__IMAGE__ND_ARRAY__DATA_TYPE, int, int], str]:
-    with file_path.open(encoding="utf-8") as file:
+    """Parse a PGM image file.
+
+    The samples of a binary raw PGM are stored big-endian. They are byte-swapped once, in place, while loading, so the
+    returned image data is always in native byte order and later arithmetic works on it without conversion.
+
+    Args:
+        file_path (Path): The PGM image file.
+
+    Returns:
+        Result[tuple[PGM__IMAGE__ND_ARRAY__DATA_TYPE, int, int], str]: The image data in native byte order, the image
+        height and the image width, or the reason of failure.
+    """
+    with file_path.open(mode="rb") as file:
         return _parse_image_header(file=file).bind(_parse_image_data_test)
 
 
 def _parse_image_header(
-    *, file: "TextIOWrapper"
-) -> Result[tuple["TextIOWrapper", ImageFormat, NetpbmMagicNumber, int, int], str]:
+    *, file: "BufferedReader"
+) -> Result[tuple["BufferedReader", ImageFormat, NetpbmMagicNumber, int, int], str]:
     header_line_count = 3
-    header_lines = list(readlines(file, header_line_count))
+    header_lines = [header_line.decode("ascii") for header_line in readlines(file, header_line_count)]
 
     netpbm_magic_number_result = parse_netpbm_magic_number(string=header_lines[0])
 
-    image_width_image_height_pattern = f"({PGM__WIDTH__PATTERN}) ({PGM__HEIGHT__PATTERN})"
-    image_width_image_height_pattern_match_result = re_match(image_width_image_height_pattern, header_lines[1])
+    image_width_image_height_pattern_match_result = re_match(PGM__WIDTH_HEIGHT__PATTERN, header_lines[1])
 
     if (
         is_successful(netpbm_magic_number_result)
         and is_successful(image_width_image_height_pattern_match_result)
-        and is_re_match_successful(str(PGM__COLOR_RANGE_MAX), header_lines[2])
+        and is_re_match_successful(PGM__COLOR_RANGE_MAX__PATTERN, header_lines[2])
     ):
         image_format = ImageFormat.pnm
         netpbm_magic_number = netpbm_magic_number_result.unwrap()
@@ -59,7 +70,7 @@ def _parse_image_header(
 
 
 def _parse_image_data_test(
-    args: tuple["TextIOWrapper", ImageFormat, NetpbmMagicNumber, int, int],
+    args: tuple["BufferedReader", ImageFormat, NetpbmMagicNumber, int, int],
 ) -> Result[tuple[PGM__IMAGE__ND_ARRAY__DATA_TYPE, int, int], str]:
     file, image_format, netpbm_magic_number, image_height, image_width = args
     match image_format:
@@ -69,6 +80,21 @@ def _parse_image_data_test(
                     image_data = np.fromfile(
                         file, dtype=PGM__IMAGE__DATA_TYPE, count=image_height * image_width, sep=" "
                     ).reshape(image_height, image_width)  # cSpell:ignore dtype
+                case NetpbmMagicNumber.Type.pgm, NetpbmMagicNumber.Encoding.binary_raw:
+                    # - The raster directly follows the header, so it is read in one go from the current position.
+                    #   - https://netpbm.sourceforge.net/doc/pgm.html
+                    #     - Each gray value is a binary number [...] if the Maxval is greater than 255, 2 bytes. The
+                    #       most significant byte is first.
+                    image_data_big_endian = np.fromfile(
+                        file, dtype=PGM__IMAGE__BINARY_RAW__DATA_TYPE, count=image_height * image_width
+                    )
+
+                    # - Swap into native byte order once, in place, instead of letting every later access convert it.
+                    #   On a big-endian host the samples are already native and are left as they are.
+                    if not image_data_big_endian.dtype.isnative:  # cSpell:ignore isnative
+                        image_data_big_endian.byteswap(inplace=True)  # cSpell:ignore byteswap
+
+                    image_data = image_data_big_endian.view(PGM__IMAGE__DATA_TYPE).reshape(image_height, image_width)
                 case _:
                     return Failure(f"not supported: NetpbmMagicNumber.Type.{netpbm_magic_number.type.name}")
 
@@ -76,3 +102,18 @@ def _parse_image_data_test(
             return Failure(f"not supported: ImageFormat.{image_format.name}")
 
     return Success((image_data, image_height, image_width))
+
+
+def image_data_from_bytes(
+    *, image_bytes: bytes, image_height: int, image_width: int
+) -> PGM__IMAGE__ND_ARRAY__DATA_TYPE:
+    """Get the image data stored in the database as an array.
+
+    The bytes are stored in native byte order by `parse_image`, so the array is a read-only view on them instead of a
+    byte-swapped copy.
+    """
+    image_data: PGM__IMAGE__ND_ARRAY__DATA_TYPE = np.frombuffer(
+        image_bytes, dtype=PGM__IMAGE__DATA_TYPE
+    )  # cSpell:ignore frombuffer dtype
+
+    return image_data.reshape(image_height, image_width)
@@ -1,22 +1,36 @@
+import io
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Final, TypeVar
+from itertools import islice
+from re import Pattern
+from typing import TYPE_CHECKING, Final
+
+import numpy as np
+import numpy.typing as npt
+from returns.pipeline import is_successful
+from returns.result import Failure, Result, Success
 
 from mcr_analyzer.config.image import CornerPositions, Position
 from mcr_analyzer.config.timezone import TZ_INFO
 from mcr_analyzer.ui.graphics_items import get_spot_corners_grid_coordinates
-from mcr_analyzer.utils.io import readline_skip, readlines
+from mcr_analyzer.utils.io import readline_skip
 from mcr_analyzer.utils.re import re_match_unwrap
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
-    from io import TextIOWrapper
     from pathlib import Path
 
 
 MCR_RSLT__DATE_TIME__FORMAT: Final[str] = "%Y-%m-%d %H:%M"
 
+# - The key is checked after matching, so one compiled pattern serves all lines instead of one pattern per key.
+MCR_RSLT__KEY_VALUE__PATTERN: Final[Pattern[str]] = re.compile(r"^(.+?): (.+)$")
+
+MCR_RSLT__SPOT__X_PREFIX: Final[str] = "X="
+MCR_RSLT__SPOT__Y_PREFIX: Final[str] = "Y="
+
 
 @dataclass()
 class Name:
@@ -28,7 +42,8 @@ class Name:
             self.display = self.original
 
 
-@dataclass(frozen=True)
+# - One instance is kept per parsed file; slots drop the per-instance `__dict__`.
+@dataclass(frozen=True, slots=True)
 class McrRslt:
     class AttributeName(Enum):
         date_time = Name("Date/time", "Measured at")
@@ -63,17 +78,19 @@ class McrRslt:
     column_count: int
     row_count: int
 
-    results: list[list[int]]
+    results: npt.NDArray[np.int64]
 
     spot_size: int
-    spots: list[list[Position]]
+    # - Shape `(row_count, column_count, 2)` with the `x` and `y` of the top left of each spot
+    spots: npt.NDArray[np.int64]
 
     image_pgm_file_path: "Path"
     corner_positions: CornerPositions
 
 
 def _parse_mcr_rslt(*, file_path: "Path") -> McrRslt:  # noqa: PLR0914
-    with file_path.open(encoding="utf-8") as file:
+    # - The file is small, so it is read at once and its lines are consumed from memory instead of the file buffer.
+    with io.StringIO(file_path.read_text(encoding="utf-8")) as file:
         date_time = datetime.strptime(
             _readline_get_value(file, McrRslt.AttributeName.date_time.value.original), MCR_RSLT__DATE_TIME__FORMAT
         ).replace(tzinfo=TZ_INFO)
@@ -96,13 +113,13 @@ def _parse_mcr_rslt(*, file_path: "Path") -> McrRslt:  # noqa: PLR0914
 
         readline_skip(file)
 
-        results = _read_mcr_rslt_table(file, row_count, column_count, int)
+        results = _read_mcr_rslt_result_table(file, row_count, column_count)
 
         readline_skip(file, 2)
 
         spot_size = int(_readline_get_value(file, McrRslt.AttributeName.spot_size.value.original))
 
-        spots = _read_mcr_rslt_table(file, row_count, column_count, _parse_spot)
+        spots = _read_mcr_rslt_spot_table(file, row_count, column_count)
 
     image_pgm_file_path = file_path.parent.joinpath(result_image_pgm)
 
@@ -114,10 +131,10 @@ def _parse_mcr_rslt(*, file_path: "Path") -> McrRslt:  # noqa: PLR0914
     bottom_right = corners_grid_coordinates.bottom_right
     bottom_left = corners_grid_coordinates.bottom_left
     corner_positions = CornerPositions(
-        top_left=spots[top_left.row][top_left.column] + offset_from_top_left_to_center,
-        top_right=spots[top_right.row][top_right.column] + offset_from_top_left_to_center,
-        bottom_right=spots[bottom_right.row][bottom_right.column] + offset_from_top_left_to_center,
-        bottom_left=spots[bottom_left.row][bottom_left.column] + offset_from_top_left_to_center,
+        top_left=Position(*spots[top_left.row, top_left.column].tolist()) + offset_from_top_left_to_center,
+        top_right=Position(*spots[top_right.row, top_right.column].tolist()) + offset_from_top_left_to_center,
+        bottom_right=Position(*spots[bottom_right.row, bottom_right.column].tolist()) + offset_from_top_left_to_center,
+        bottom_left=Position(*spots[bottom_left.row, bottom_left.column].tolist()) + offset_from_top_left_to_center,
     )
 
     return McrRslt(
@@ -141,44 +158,62 @@ def _parse_mcr_rslt(*, file_path: "Path") -> McrRslt:  # noqa: PLR0914
     )
 
 
-def _readline_get_value(file: "TextIOWrapper", key_pattern: str, value_pattern: str = ".+") -> str:
+def _readline_get_value(file: io.StringIO, key: str) -> str:
     string = file.readline()
 
-    match = re_match_unwrap(f"^({key_pattern}): ({value_pattern})$", string)
+    match = re_match_unwrap(MCR_RSLT__KEY_VALUE__PATTERN, string)
+
+    key_result: str = match.group(1)
+    if key != key_result:
+        msg = f"not matched: {key} != {key_result}"
+        raise ValueError(msg)
 
     value: str = match.group(2)
 
     return value
 
 
-T = TypeVar("T")
+def _read_mcr_rslt_result_table(file: io.StringIO, row_count: int, column_count: int) -> npt.NDArray[np.int64]:
+    table = _read_mcr_rslt_table(file, row_count, column_count)
+
+    return np.loadtxt(table, dtype=np.int64, usecols=range(1, 1 + column_count), ndmin=2)
+
+
+def _read_mcr_rslt_spot_table(file: io.StringIO, row_count: int, column_count: int) -> npt.NDArray[np.int64]:
+    table = _read_mcr_rslt_table(file, row_count, column_count)
+
+    # - `X=93Y=73` becomes ` 93 73` in one pass over the whole table instead of one regex match per spot; row labels
+    #   are not followed by `=` and stay intact.
+    table = "".join(table).replace(MCR_RSLT__SPOT__X_PREFIX, " ").replace(MCR_RSLT__SPOT__Y_PREFIX, " ").splitlines()
+
+    return np.loadtxt(table, dtype=np.int64, usecols=range(1, 1 + 2 * column_count), ndmin=2).reshape(
+        row_count, column_count, 2
+    )
+
 
+def _read_mcr_rslt_table(file: io.StringIO, row_count: int, column_count: int) -> list[str]:
+    """Read the rows of a table, each still starting with its row label, without its header row.
 
-def _read_mcr_rslt_table(
-    file: "TextIOWrapper", row_count: int, column_count: int, fn: "Callable[[str], T]"
-) -> list[list[T]]:
+    The rows are sliced off the file at once and the items are parsed in C by `np.loadtxt`, which skips the row labels
+    by `usecols` and raises `ValueError` for malformed items and short rows as well.
+    """
     skip_header_row = 1
     skip_header_column = 1
 
     readline_skip(file, skip_header_row)
 
-    mcr_rslt_table = [[fn(item) for item in line.split()[skip_header_column:]] for line in readlines(file, row_count)]
+    table = list(islice(file, row_count))
+
+    if len(table) != row_count:
+        msg = f"not matched: {row_count} != {len(table)}"
+        raise ValueError(msg)
 
-    number_of_columns_result = len(mcr_rslt_table[0])
+    number_of_columns_result = len(table[0].split()) - skip_header_column
     if column_count != number_of_columns_result:
         msg = f"not matched: {column_count} != {number_of_columns_result}"
         raise ValueError(msg)
 
-    return mcr_rslt_table
-
-
-def _parse_spot(string: str) -> Position:
-    match = re_match_unwrap(r"X=(\d+)Y=(\d+)", string)
-
-    x = int(match.group(1))
-    y = int(match.group(2))
-
-    return Position(x, y)
+    return table
 
 
 def parse_mcr_rslt_in_directory_recursively(directory_path: "Path") -> tuple[list[McrRslt], list[str]]:
@@ -189,17 +224,30 @@ def parse_mcr_rslt_in_directory_recursively(directory_path: "Path") -> tuple[lis
     mcr_rslt_list: list[McrRslt] = []
     mcr_rslt_file_name_parse_fail_list: list[str] = []
 
-    mcr_rslt_file_path_generator = directory_path.glob("**/*.rslt")
-    for mcr_rslt_file_path in mcr_rslt_file_path_generator:
-        try:
-            mcr_rslt = _parse_mcr_rslt(file_path=mcr_rslt_file_path)
-        except ValueError:
-            mcr_rslt_file_name_parse_fail_list.append(mcr_rslt_file_path.name)
+    mcr_rslt_file_path_list = list(directory_path.glob("**/*.rslt"))
+
+    # - Parsing one file takes only a few tens of microseconds, so the scan is dominated by file system latency (e.g. on
+    #   network shares), which threads overlap. Processes would have to import Qt and pickle each result instead.
+    with ThreadPoolExecutor() as executor:
+        mcr_rslt_result_list = list(executor.map(_parse_mcr_rslt_safely, mcr_rslt_file_path_list))
+
+    for mcr_rslt_result in mcr_rslt_result_list:
+        if not is_successful(mcr_rslt_result):
+            mcr_rslt_file_name_parse_fail_list.append(mcr_rslt_result.failure())
             continue
 
+        mcr_rslt = mcr_rslt_result.unwrap()
+
         image_pgm_file_path = mcr_rslt.image_pgm_file_path
 
         if image_pgm_file_path.exists():
             mcr_rslt_list.append(mcr_rslt)
 
     return mcr_rslt_list, mcr_rslt_file_name_parse_fail_list
+
+
+def _parse_mcr_rslt_safely(file_path: "Path") -> Result[McrRslt, str]:
+    try:
+        return Success(_parse_mcr_rslt(file_path=file_path))
+    except ValueError:
+        return Failure(file_path.name)
@@ -8,7 +8,8 @@ from mcr_analyzer.config.image import CornerPositions, Position
 from mcr_analyzer.config.qt import q_color_with_alpha
 
 
-@dataclass(frozen=True)
+# - One instance is kept per spot of a grid and of each group; slots drop the per-instance `__dict__`.
+@dataclass(frozen=True, slots=True)
 class GridCoordinates:
     row: int
     column: int
@@ -51,12 +52,6 @@ def _is_spot(*, grid_coordinates: GridCoordinates) -> bool:
     return row >= 0 and column >= 0
 
 
-def _is_spot_corner(*, grid_coordinates: GridCoordinates, row_count: int, column_count: int) -> bool:
-    return get_spot_corners_grid_coordinates(row_count=row_count, column_count=column_count).has(
-        grid_coordinates=grid_coordinates
-    )
-
-
 def get_spot_corners_grid_coordinates(*, row_count: int, column_count: int) -> CornersGridCoordinates:
     row_min = 0
     row_max = row_count - 1
@@ -71,7 +66,7 @@ def get_spot_corners_grid_coordinates(*, row_count: int, column_count: int) -> C
     )
 
 
-def get_items_position(
+def get_items_position(  # noqa: PLR0914
     *, row_count: int, column_count: int, corner_positions: CornerPositions
 ) -> tuple[dict[GridCoordinates, Position], dict[GridCoordinates, Position], dict[GridCoordinates, Position]]:
     top_left = corner_positions.top_left
@@ -81,17 +76,23 @@ def get_items_position(
 
     label_index = -1
 
+    # - Computed once instead of for every item in the loops below
+    corners_grid_coordinates = get_spot_corners_grid_coordinates(row_count=row_count, column_count=column_count)
+    left_difference = bottom_left - top_left
+    right_difference = bottom_right - top_right
+
     row_labels_position: dict[GridCoordinates, Position] = {}
     column_labels_position: dict[GridCoordinates, Position] = {}
     spots_position: dict[GridCoordinates, Position] = {}
 
     for row in range(label_index, row_count):
-        row_i_left = top_left + (bottom_left - top_left) * row / (row_count - 1)
-        row_i_right = top_right + (bottom_right - top_right) * row / (row_count - 1)
+        row_i_left = top_left + left_difference * row / (row_count - 1)
+        row_i_right = top_right + right_difference * row / (row_count - 1)
+        row_i_difference = row_i_right - row_i_left
 
         for column in range(label_index, column_count):
             grid_coordinates = GridCoordinates(row=row, column=column)
-            position = row_i_left + (row_i_right - row_i_left) * column / (column_count - 1)
+            position = row_i_left + row_i_difference * column / (column_count - 1)
 
             if not _is_top_left_label_corner(grid_coordinates=grid_coordinates, label_index=label_index):
                 if _is_row_label(grid_coordinates=grid_coordinates, label_index=label_index):
@@ -100,37 +101,14 @@ def get_items_position(
                 elif _is_column_label(grid_coordinates=grid_coordinates, label_index=label_index):
                     column_labels_position[grid_coordinates] = position
 
-                elif _is_spot(grid_coordinates=grid_coordinates) and not _is_spot_corner(
-                    grid_coordinates=grid_coordinates, row_count=row_count, column_count=column_count
+                elif _is_spot(grid_coordinates=grid_coordinates) and not corners_grid_coordinates.has(
+                    grid_coordinates=grid_coordinates
                 ):
                     spots_position[grid_coordinates] = position
 
     return row_labels_position, column_labels_position, spots_position
 
 
-def get_spots_position(
-    *, row_count: int, column_count: int, corner_positions: CornerPositions
-) -> dict[GridCoordinates, Position]:
-    top_left = corner_positions.top_left
-    top_right = corner_positions.top_right
-    bottom_right = corner_positions.bottom_right
-    bottom_left = corner_positions.bottom_left
-
-    spots_position: dict[GridCoordinates, Position] = {}
-
-    for row in range(row_count):
-        row_i_left = top_left + (bottom_left - top_left) * row / (row_count - 1)
-        row_i_right = top_right + (bottom_right - top_right) * row / (row_count - 1)
-
-        for column in range(column_count):
-            grid_coordinates = GridCoordinates(row=row, column=column)
-            position = row_i_left + (row_i_right - row_i_left) * column / (column_count - 1)
-
-            spots_position[grid_coordinates] = position
-
-    return spots_position
-
-
 def _get_top_left_relative_to_center(*, width: float, height: float, center_point: Position | None = None) -> Position:
     if center_point is None:
         center_point = Position(0, 0)
@@ -292,7 +270,7 @@ def set_spot_item_group_name_group_color(
     spot_item.set_tool_tip(tool_tip=group_name)
 
 
-@dataclass()
+@dataclass(slots=True)
 class GroupInfo:
     name: str
     notes: str
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Any, TypeVar
 from PyQt6.QtCore import QRectF, Qt, pyqtSignal
 from PyQt6.QtGui import QColor
 from PyQt6.QtWidgets import QGraphicsItem, QGraphicsObject, QStyleOptionGraphicsItem, QWidget
-from sqlalchemy.sql.expression import select
+from sqlalchemy import inspect
 
 from mcr_analyzer.config.image import CornerPositions, Position
 from mcr_analyzer.database.models import Measurement
@@ -20,7 +20,7 @@ from mcr_analyzer.ui.graphics_items import (
     get_spot_corners_grid_coordinates,
     set_spot_item_group_name_group_color,
 )
-from mcr_analyzer.ui.models import get_group_info_dict_from_database
+from mcr_analyzer.ui.models import get_group_info_dict_from_database, get_group_info_dict_from_groups
 from mcr_analyzer.utils.set import get_set_differences
 
 if TYPE_CHECKING:
@@ -151,8 +151,9 @@ class Grid(QGraphicsObject):
         pass
 
     def _initialize_instance_variables(self, *, session: "Session", measurement_id: int) -> None:
-        statement = select(Measurement).where(Measurement.id == measurement_id)
-        measurement = session.execute(statement).scalar_one()
+        # - The callers have usually just loaded the measurement in this session, so it is taken from the identity map
+        #   without another `SELECT`.
+        measurement = session.get_one(Measurement, measurement_id)
 
         column_count = measurement.column_count
         row_count = measurement.row_count
@@ -167,7 +168,12 @@ class Grid(QGraphicsObject):
         spot_corner_bottom_left_x = measurement.spot_corner_bottom_left_x
         spot_corner_bottom_left_y = measurement.spot_corner_bottom_left_y
 
-        group_info_dict = get_group_info_dict_from_database(session=session, measurement_id=measurement_id)
+        # - Callers that handle many measurements eager load `Measurement.groups` and `Group.spots` for all of them at
+        #   once, so no per-measurement queries are needed then.
+        if "groups" in inspect(measurement).unloaded:
+            group_info_dict = get_group_info_dict_from_database(session=session, measurement_id=measurement_id)
+        else:
+            group_info_dict = get_group_info_dict_from_groups(measurement.groups)
 
         corners_grid_coordinates = get_spot_corners_grid_coordinates(row_count=row_count, column_count=column_count)
 
@@ -439,15 +445,15 @@ class Grid(QGraphicsObject):
     def get_spot_size(self) -> float:
         return self.corner_spots.top_left.get_size()
 
-    def _get_grouped_spots_grid_coordinates(self) -> list[GridCoordinates]:
-        grouped_spots_grid_coordinates = []
-        for group_info in self._group_info_dict.values():
-            grouped_spots_grid_coordinates += group_info.spots_grid_coordinates
-
-        return grouped_spots_grid_coordinates
+    def get_grouped_spots_grid_coordinates(self) -> set[GridCoordinates]:
+        return {
+            spot_grid_coordinates
+            for group_info in self._group_info_dict.values()
+            for spot_grid_coordinates in group_info.spots_grid_coordinates
+        }
 
     def is_grouped(self, *, spot_grid_coordinates: GridCoordinates) -> bool:
-        return spot_grid_coordinates in self._get_grouped_spots_grid_coordinates()
+        return spot_grid_coordinates in self.get_grouped_spots_grid_coordinates()
 
     def has_group_name(self, *, group_name: str) -> bool:
         return self._group_info_dict.get(group_name) is not None
@@ -470,15 +476,23 @@ class Grid(QGraphicsObject):
     def select_group(self, *, name: str) -> None:
         self._clear_selection()
 
+        row_count = self.get_row_count()
+        column_count = self.get_column_count()
+
         for grid_coordinates in self._group_info_dict[name].spots_grid_coordinates:
-            self._select_spot_item(grid_coordinates=grid_coordinates)
+            self._select_spot_item(grid_coordinates=grid_coordinates, row_count=row_count, column_count=column_count)
 
     def _clear_selection(self) -> None:
         self.scene().clearSelection()
 
-    def _select_spot_item(self, *, grid_coordinates: GridCoordinates) -> None:
-        row_count = self.get_row_count()
-        column_count = self.get_column_count()
+    def _select_spot_item(
+        self, *, grid_coordinates: GridCoordinates, row_count: int | None = None, column_count: int | None = None
+    ) -> None:
+        if row_count is None:
+            row_count = self.get_row_count()
+
+        if column_count is None:
+            column_count = self.get_column_count()
 
         spot_corner_position = get_spot_corner_position(
             grid_coordinates=grid_coordinates, row_count=row_count, column_count=column_count
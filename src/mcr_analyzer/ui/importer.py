@@ -1,7 +1,9 @@
-import hashlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from PyQt6.QtCore import pyqtSignal, pyqtSlot
+from PyQt6.QtCore import QObject, Qt, QThread, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QStandardItem, QStandardItemModel
 from PyQt6.QtWidgets import (
     QHeaderView,
@@ -15,10 +17,19 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 from returns.pipeline import is_successful
+from returns.result import Failure, Success
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.sql.expression import select
 
-from mcr_analyzer.config.hash import HASH__DIGEST_SIZE
-from mcr_analyzer.config.importer import IMPORTER__COLUMN_INDEX__STATUS
+from mcr_analyzer.config.hash import get_hash_digest
+from mcr_analyzer.config.importer import (
+    IMPORTER__COLUMN_INDEX__STATUS,
+    IMPORTER__COMMIT__BATCH_SIZE,
+    IMPORTER__STATUS__IMPORT_FAILED,
+    IMPORTER__STATUS__IMPORT_SUCCESSFUL,
+    IMPORTER__STATUS__IMPORTED_PREVIOUSLY,
+)
 from mcr_analyzer.config.qt import BUTTON__ICON_SIZE
 from mcr_analyzer.database.database import database
 from mcr_analyzer.database.models import Measurement
@@ -27,8 +38,14 @@ from mcr_analyzer.io.mcr_rslt import MCR_RSLT__DATE_TIME__FORMAT, McrRslt, parse
 from mcr_analyzer.utils.q_file_dialog import FileDialog
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
     from pathlib import Path
 
+    from returns.result import Result
+    from sqlalchemy.orm import Session
+
+    from mcr_analyzer.config.netpbm import PGM__IMAGE__ND_ARRAY__DATA_TYPE  # cSpell:ignore netpbm
+
 
 class ImportWidget(QWidget):
     database_missing = pyqtSignal()
@@ -48,6 +65,12 @@ class ImportWidget(QWidget):
         self.mcr_rslt_list: list[McrRslt] = []
         self.mcr_rslt_file_name_parse_fail_list: list[str] = []
 
+        self._scan_thread: QThread | None = None
+        self._scan_worker: _ScanWorker | None = None
+
+        self._import_thread: QThread | None = None
+        self._import_worker: _ImportWorker | None = None
+
         layout = QVBoxLayout(self)
 
         self.select_folder_button = QPushButton(
@@ -69,8 +92,15 @@ class ImportWidget(QWidget):
 
         self.measurements_table = QTableView()
         self.measurements_table.verticalHeader().hide()
-        self.measurements_table.horizontalHeader().setStretchLastSection(True)
-        self.measurements_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+
+        # - A table view always has a horizontal header; the optional return type only mirrors `setHorizontalHeader`.
+        measurements_table_header = self.measurements_table.horizontalHeader()
+        assert measurements_table_header is not None  # noqa: S101
+
+        self.measurements_table_header = measurements_table_header
+        self.measurements_table_header.setStretchLastSection(True)
+        self.measurements_table_header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+
         self.measurements_table.hide()
         layout.addWidget(self.measurements_table)
 
@@ -86,7 +116,41 @@ class ImportWidget(QWidget):
 
         directory_path = FileDialog.get_directory_path(parent=self)
 
-        self._parse_rslt_into_mcr_rslt_list(directory_path)
+        if directory_path is None:
+            self.file_model.removeRows(0, self.file_model.rowCount())
+            self._file_model_show()
+            return
+
+        self.select_folder_button.setEnabled(False)
+        self.import_button.setEnabled(False)
+
+        # - The folder is scanned on its own thread, so the window keeps responding while e.g. a network share is read.
+        self._scan_worker = _ScanWorker(directory_path=directory_path)
+        self._scan_thread = _start_worker_thread(
+            parent=self, worker=self._scan_worker, thread_finished=self._scan_thread_finished
+        )
+
+    @pyqtSlot()
+    def _scan_thread_finished(self) -> None:
+        if self._scan_worker is not None:
+            self.mcr_rslt_list = self._scan_worker.mcr_rslt_list
+            self.mcr_rslt_file_name_parse_fail_list = self._scan_worker.mcr_rslt_file_name_parse_fail_list
+
+            self._scan_worker.deleteLater()
+            self._scan_worker = None
+
+        if self._scan_thread is not None:
+            self._scan_thread.deleteLater()
+            self._scan_thread = None
+
+        self._file_model_update()
+        self._file_model_show()
+
+        self.select_folder_button.setEnabled(True)
+        self.import_button.setEnabled(True)
+
+    def _file_model_show(self) -> None:
+        self.measurements_table.setModel(self.file_model)
 
         self.progress_bar.setValue(0)
         self.progress_bar.setMaximum(len(self.mcr_rslt_list))
@@ -96,57 +160,79 @@ class ImportWidget(QWidget):
 
     @pyqtSlot()
     def _import(self) -> None:
-        self._write_mcr_rslt_list_to_database()
+        self.select_folder_button.setEnabled(False)
+        self.import_button.setEnabled(False)
+
+        # - With `ResizeToContents`, every changed status item makes the header measure all rows again, which is
+        #   quadratic in the number of measurements. The columns are resized once after all updates instead.
+        self.measurements_table_header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+
+        # - The import runs on its own thread, so the table and the progress bar keep updating while it is running.
+        self._import_worker = _ImportWorker(mcr_rslt_list=self.mcr_rslt_list)
+        self._import_worker.measurement_imported.connect(self._measurement_imported)
+        self._import_thread = _start_worker_thread(
+            parent=self, worker=self._import_worker, thread_finished=self._import_thread_finished
+        )
+
+    @pyqtSlot()
+    def _import_thread_finished(self) -> None:
+        self.measurements_table_header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+
+        if self._import_worker is not None:
+            self._import_worker.deleteLater()
+            self._import_worker = None
+
+        if self._import_thread is not None:
+            self._import_thread.deleteLater()
+            self._import_thread = None
+
+        self.select_folder_button.setEnabled(True)
+        self.import_button.setEnabled(True)
 
         self.import_button.hide()
         self.import_finished.emit()
 
-    def _parse_rslt_into_mcr_rslt_list(self, directory_path: "Path | None") -> None:
+    def wait_for_threads(self) -> None:
+        """Block until a running folder scan or import, including all of its database writes, has finished."""
+        for thread in (self._scan_thread, self._import_thread):
+            if thread is not None:
+                thread.wait()
+
+    def _file_model_update(self) -> None:
         self.file_model.removeRows(0, self.file_model.rowCount())
 
-        if directory_path is not None:
-            self.mcr_rslt_list, self.mcr_rslt_file_name_parse_fail_list = parse_mcr_rslt_in_directory_recursively(
-                directory_path
+        for mcr_rslt_file_name_parse_fail in self.mcr_rslt_file_name_parse_fail_list:
+            status_error_item = QStandardItem(
+                f"Failed to load '{mcr_rslt_file_name_parse_fail}', might be a corrupted file."
             )
 
-            for mcr_rslt_file_name_parse_fail in self.mcr_rslt_file_name_parse_fail_list:
-                status_error_item = QStandardItem(
-                    f"Failed to load '{mcr_rslt_file_name_parse_fail}', might be a corrupted file."
-                )
-
-                status_error_item.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogNoButton))
-
-                measurement = [
-                    QStandardItem("n. a."),
-                    QStandardItem("n. a."),
-                    QStandardItem("n. a."),
-                    status_error_item,
-                ]
+            status_error_item.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogNoButton))
 
-                self.file_model.appendRow(measurement)
+            measurement = [QStandardItem("n. a."), QStandardItem("n. a."), QStandardItem("n. a."), status_error_item]
 
-            for mcr_rslt in self.mcr_rslt_list:
-                status_success_item = QStandardItem("")
+            self.file_model.appendRow(measurement)
 
-                measurement = [
-                    QStandardItem(mcr_rslt.date_time.strftime(MCR_RSLT__DATE_TIME__FORMAT)),
-                    QStandardItem(mcr_rslt.probe_id),
-                    QStandardItem(mcr_rslt.chip_id),
-                    status_success_item,
-                ]
-                self.file_model.appendRow(measurement)
-
-        self.measurements_table.setModel(self.file_model)
+        for mcr_rslt in self.mcr_rslt_list:
+            status_success_item = QStandardItem("")
 
-    def _write_mcr_rslt_list_to_database(self) -> None:
-        for i, mcr_rslt in enumerate(self.mcr_rslt_list):
-            file_model_item_text, file_model_item_icon_pixmap = _write_mcr_rslt_to_database(mcr_rslt=mcr_rslt)
+            measurement = [
+                QStandardItem(mcr_rslt.date_time.strftime(MCR_RSLT__DATE_TIME__FORMAT)),
+                QStandardItem(mcr_rslt.probe_id),
+                QStandardItem(mcr_rslt.chip_id),
+                status_success_item,
+            ]
+            self.file_model.appendRow(measurement)
 
-            self._measurement_table_update(
-                i=i, file_model_item_text=file_model_item_text, file_model_item_icon_pixmap=file_model_item_icon_pixmap
-            )
+    @pyqtSlot(int, str, QStyle.StandardPixmap)
+    def _measurement_imported(
+        self, i: int, file_model_item_text: str, file_model_item_icon_pixmap: QStyle.StandardPixmap
+    ) -> None:
+        self._measurement_table_update(
+            i=i, file_model_item_text=file_model_item_text, file_model_item_icon_pixmap=file_model_item_icon_pixmap
+        )
 
-            self.progress_bar.setValue(i + 1)
+        # - Measurements are reported once their batch is committed, which is not necessarily in their order.
+        self.progress_bar.setValue(self.progress_bar.value() + 1)
 
     def _measurement_table_update(
         self, *, i: int, file_model_item_text: str, file_model_item_icon_pixmap: QStyle.StandardPixmap
@@ -161,60 +247,276 @@ class ImportWidget(QWidget):
         file_model_item.setIcon(self.style().standardIcon(file_model_item_icon_pixmap))
 
 
-def _write_mcr_rslt_to_database(*, mcr_rslt: McrRslt) -> tuple[str, QStyle.StandardPixmap]:
-    image_result = parse_image(file_path=mcr_rslt.image_pgm_file_path)
+def _start_worker_thread(
+    *, parent: QObject, worker: "_ScanWorker | _ImportWorker", thread_finished: "Callable[[], None]"
+) -> QThread:
+    thread = QThread(parent)
+    worker.moveToThread(thread)
 
-    if not is_successful(image_result):
-        file_model_item_text = image_result.failure()
-        file_model_item_icon_pixmap = QStyle.StandardPixmap.SP_DialogNoButton
-
-    else:
-        image_data, image_height, image_width = image_result.unwrap()
-
-        image_hash_object = hashlib.sha256(image_data)  # cSpell:ignore tobytes
-        if image_hash_object.digest_size != HASH__DIGEST_SIZE:
-            msg = f"invalid hash digest size: {image_hash_object.digest_size} (expected: {HASH__DIGEST_SIZE})"
-            raise ValueError(msg)
-
-        image_hash = image_hash_object.digest()
-
-        with database.Session() as session:
-            exists = session.execute(
-                select(select(Measurement).where(Measurement.image_hash == image_hash).exists())
-            ).scalar_one()
-
-        if exists:
-            file_model_item_text = "Imported previously"
-            file_model_item_icon_pixmap = QStyle.StandardPixmap.SP_DialogNoButton
-
-        else:
-            with database.Session() as session, session.begin():
-                measurement = Measurement(
-                    date_time=mcr_rslt.date_time,
-                    device_id=mcr_rslt.device_id,
-                    probe_id=mcr_rslt.probe_id,
-                    chip_id=mcr_rslt.chip_id,
-                    image_data=image_data,  # cSpell:ignore ascontiguousarray
-                    image_height=image_height,
-                    image_width=image_width,
-                    image_hash=image_hash,
-                    row_count=mcr_rslt.row_count,
-                    column_count=mcr_rslt.column_count,
-                    spot_size=mcr_rslt.spot_size,
-                    spot_corner_top_left_x=mcr_rslt.corner_positions.top_left.x(),
-                    spot_corner_top_left_y=mcr_rslt.corner_positions.top_left.y(),
-                    spot_corner_top_right_x=mcr_rslt.corner_positions.top_right.x(),
-                    spot_corner_top_right_y=mcr_rslt.corner_positions.top_right.y(),
-                    spot_corner_bottom_right_x=mcr_rslt.corner_positions.bottom_right.x(),
-                    spot_corner_bottom_right_y=mcr_rslt.corner_positions.bottom_right.y(),
-                    spot_corner_bottom_left_x=mcr_rslt.corner_positions.bottom_left.x(),
-                    spot_corner_bottom_left_y=mcr_rslt.corner_positions.bottom_left.y(),
-                    notes="",
+    thread.started.connect(worker.run)
+    # - `quit` is called directly from the worker thread, so the thread also ends while the UI thread blocks in `wait`.
+    # - The PyQt6 stubs omit the connection type argument of `connect`.
+    worker.finished.connect(thread.quit, type=Qt.ConnectionType.DirectConnection)  # type: ignore[call-arg]
+    thread.finished.connect(thread_finished)
+
+    thread.start()
+
+    return thread
+
+
+class _ScanWorker(QObject):
+    finished = pyqtSignal()
+
+    def __init__(self, *, directory_path: "Path") -> None:
+        super().__init__()
+
+        self.directory_path = directory_path
+
+        self.mcr_rslt_list: list[McrRslt] = []
+        self.mcr_rslt_file_name_parse_fail_list: list[str] = []
+
+    @pyqtSlot()
+    def run(self) -> None:
+        try:
+            self.mcr_rslt_list, self.mcr_rslt_file_name_parse_fail_list = parse_mcr_rslt_in_directory_recursively(
+                self.directory_path
+            )
+        finally:
+            self.finished.emit()
+
+
+class _ImportWorker(QObject):
+    measurement_imported = pyqtSignal(int, str, QStyle.StandardPixmap)
+    finished = pyqtSignal()
+
+    def __init__(self, *, mcr_rslt_list: list[McrRslt]) -> None:
+        super().__init__()
+
+        self.mcr_rslt_list = mcr_rslt_list
+
+    @pyqtSlot()
+    def run(self) -> None:
+        try:
+            self._write_mcr_rslt_list_to_database()
+        finally:
+            self.finished.emit()
+
+    def _write_mcr_rslt_list_to_database(self) -> None:
+        # - Images whose cached digest is already in the database were imported before and are neither read nor hashed.
+        image_hash_list = [
+            _get_image_hash_digest_from_cache(mcr_rslt.image_pgm_file_path) for mcr_rslt in self.mcr_rslt_list
+        ]
+        imported_image_hash_set = _get_imported_image_hash_set([
+            image_hash for image_hash in image_hash_list if image_hash is not None
+        ])
+
+        i_list: list[int] = []
+
+        for i, image_hash in enumerate(image_hash_list):
+            if image_hash in imported_image_hash_set:
+                self.measurement_imported.emit(
+                    i, IMPORTER__STATUS__IMPORTED_PREVIOUSLY, QStyle.StandardPixmap.SP_DialogNoButton
                 )
+            else:
+                i_list.append(i)
+
+        # - The inserts share one session and are committed in batches instead of one transaction per measurement. The
+        #   measurements of a batch are only reported once it is committed.
+        batch = _ImportBatch()
+
+        with ThreadPoolExecutor() as executor, database.Session() as session:
+            image_result_iterator = _parse_image_with_hash_digest_iterator(
+                executor=executor, mcr_rslt_list=[self.mcr_rslt_list[i] for i in i_list]
+            )
+
+            for i, image_result in zip(i_list, image_result_iterator, strict=True):
+                try:
+                    write_result = _write_mcr_rslt_to_database(
+                        session=session, mcr_rslt=self.mcr_rslt_list[i], image_result=image_result
+                    )
+
+                except SQLAlchemyError:
+                    session.rollback()
+                    self._emit_measurement_imported_failed(batch=batch, i=i)
+                    continue
+
+                if not is_successful(write_result):
+                    self.measurement_imported.emit(i, write_result.failure(), QStyle.StandardPixmap.SP_DialogNoButton)
+                    continue
+
+                image_hash = image_result.unwrap()[3]
+
+                if write_result.unwrap():
+                    batch.inserted_i_list.append(i)
+                    batch.image_hash_set.add(image_hash)
+
+                    if len(batch.inserted_i_list) == IMPORTER__COMMIT__BATCH_SIZE:
+                        self._commit(session=session, batch=batch)
+
+                elif image_hash in batch.image_hash_set:
+                    batch.duplicate_i_list.append(i)
+
+                else:
+                    self.measurement_imported.emit(
+                        i, IMPORTER__STATUS__IMPORTED_PREVIOUSLY, QStyle.StandardPixmap.SP_DialogNoButton
+                    )
+
+            self._commit(session=session, batch=batch)
+
+        # - The session of this thread is not needed after the import.
+        database.Session.remove()
+
+    def _commit(self, *, session: "Session", batch: "_ImportBatch") -> None:
+        try:
+            session.commit()
+
+        except SQLAlchemyError:
+            session.rollback()
+            self._emit_measurement_imported_failed(batch=batch)
+            return
+
+        for i in batch.inserted_i_list:
+            self.measurement_imported.emit(
+                i, IMPORTER__STATUS__IMPORT_SUCCESSFUL, QStyle.StandardPixmap.SP_DialogYesButton
+            )
+
+        for i in batch.duplicate_i_list:
+            self.measurement_imported.emit(
+                i, IMPORTER__STATUS__IMPORTED_PREVIOUSLY, QStyle.StandardPixmap.SP_DialogNoButton
+            )
+
+        batch.clear()
+
+    def _emit_measurement_imported_failed(self, *, batch: "_ImportBatch", i: int | None = None) -> None:
+        """Report the measurements of the rolled back batch, and the one whose write failed, as failed."""
+        i_list = [*batch.inserted_i_list, *batch.duplicate_i_list]
+        if i is not None:
+            i_list.append(i)
+
+        for i_failed in sorted(i_list):
+            self.measurement_imported.emit(
+                i_failed, IMPORTER__STATUS__IMPORT_FAILED, QStyle.StandardPixmap.SP_DialogNoButton
+            )
+
+        batch.clear()
 
-                session.add(measurement)
 
-            file_model_item_text = "Import successful"
-            file_model_item_icon_pixmap = QStyle.StandardPixmap.SP_DialogYesButton
+@dataclass()
+class _ImportBatch:
+    """The measurements written since the last commit, which are lost if the commit fails."""
+
+    inserted_i_list: list[int] = field(default_factory=list)
+    # - Measurements skipped because an image of the same batch is the same, so they are only imported previously once
+    #   the batch is committed.
+    duplicate_i_list: list[int] = field(default_factory=list)
+    image_hash_set: set[bytes] = field(default_factory=set)
+
+    def clear(self) -> None:
+        self.inserted_i_list.clear()
+        self.duplicate_i_list.clear()
+        self.image_hash_set.clear()
+
+
+# - Image digests keyed by file path, modification time and size, kept for the lifetime of the application.
+_image_hash_digest_cache: dict[tuple["Path", int, int], bytes] = {}
+
+
+def _get_image_hash_digest_cache_key(file_path: "Path") -> tuple["Path", int, int]:
+    stat_result = file_path.stat()
+
+    return file_path.resolve(), stat_result.st_mtime_ns, stat_result.st_size
+
+
+def _get_image_hash_digest_from_cache(file_path: "Path") -> bytes | None:
+    return _image_hash_digest_cache.get(_get_image_hash_digest_cache_key(file_path))
+
+
+def _get_imported_image_hash_set(image_hash_list: list[bytes]) -> set[bytes]:
+    if len(image_hash_list) == 0:
+        return set()
+
+    with database.Session() as session:
+        return set(
+            session.execute(select(Measurement.image_hash).where(Measurement.image_hash.in_(image_hash_list))).scalars()
+        )
+
+
+def _parse_image_with_hash_digest_iterator(
+    *, executor: ThreadPoolExecutor, mcr_rslt_list: list[McrRslt]
+) -> "Iterator[Result[tuple[PGM__IMAGE__ND_ARRAY__DATA_TYPE, int, int, bytes], str]]":
+    """Read and hash the images on the executor threads, yielding the results in order.
+
+    Unlike `Executor.map`, which submits all images at once and keeps every decoded image until it is consumed, at most
+    `IMPORTER__COMMIT__BATCH_SIZE` images are read ahead of the consumer.
+    """
+    future_deque: deque[Future[Result[tuple[PGM__IMAGE__ND_ARRAY__DATA_TYPE, int, int, bytes], str]]] = deque()
+
+    for mcr_rslt in mcr_rslt_list:
+        if len(future_deque) == IMPORTER__COMMIT__BATCH_SIZE:
+            yield future_deque.popleft().result()
+
+        future_deque.append(executor.submit(_parse_image_with_hash_digest, mcr_rslt))
+
+    while len(future_deque) > 0:
+        yield future_deque.popleft().result()
+
+
+def _parse_image_with_hash_digest(
+    mcr_rslt: McrRslt,
+) -> "Result[tuple[PGM__IMAGE__ND_ARRAY__DATA_TYPE, int, int, bytes], str]":
+    file_path = mcr_rslt.image_pgm_file_path
+
+    # - The key is taken before reading, so a file modified meanwhile is hashed again next time.
+    cache_key = _get_image_hash_digest_cache_key(file_path)
+
+    image_result = parse_image(file_path=file_path).map(lambda image: (*image, get_hash_digest(image[0])))
+
+    if is_successful(image_result):
+        _image_hash_digest_cache[cache_key] = image_result.unwrap()[3]
+
+    return image_result
+
+
+def _write_mcr_rslt_to_database(
+    *,
+    session: "Session",
+    mcr_rslt: McrRslt,
+    image_result: "Result[tuple[PGM__IMAGE__ND_ARRAY__DATA_TYPE, int, int, bytes], str]",
+) -> "Result[bool, str]":
+    """Insert the measurement without committing, returning whether it was inserted or had been imported before."""
+    if not is_successful(image_result):
+        return Failure(image_result.failure())
+
+    image_data, image_height, image_width, image_hash = image_result.unwrap()
+
+    # - A single `INSERT ... ON CONFLICT DO NOTHING RETURNING id` replaces the former existence query followed by
+    #   an ORM insert; a conflict on the unique `image_hash` yields no row.
+    statement = (
+        insert(Measurement)
+        .values(
+            date_time=mcr_rslt.date_time,
+            device_id=mcr_rslt.device_id,
+            probe_id=mcr_rslt.probe_id,
+            chip_id=mcr_rslt.chip_id,
+            image_data=image_data,
+            image_height=image_height,
+            image_width=image_width,
+            image_hash=image_hash,
+            row_count=mcr_rslt.row_count,
+            column_count=mcr_rslt.column_count,
+            spot_size=mcr_rslt.spot_size,
+            spot_corner_top_left_x=mcr_rslt.corner_positions.top_left.x(),
+            spot_corner_top_left_y=mcr_rslt.corner_positions.top_left.y(),
+            spot_corner_top_right_x=mcr_rslt.corner_positions.top_right.x(),
+            spot_corner_top_right_y=mcr_rslt.corner_positions.top_right.y(),
+            spot_corner_bottom_right_x=mcr_rslt.corner_positions.bottom_right.x(),
+            spot_corner_bottom_right_y=mcr_rslt.corner_positions.bottom_right.y(),
+            spot_corner_bottom_left_x=mcr_rslt.corner_positions.bottom_left.x(),
+            spot_corner_bottom_left_y=mcr_rslt.corner_positions.bottom_left.y(),
+            notes="",
+        )
+        .on_conflict_do_nothing()
+        .returning(Measurement.id)
+    )
 
-    return file_model_item_text, file_model_item_icon_pixmap
+    return Success(session.execute(statement).scalar_one_or_none() is not None)
@@ -1,22 +1,23 @@
 from pathlib import Path
 
-import numpy as np
-from PyQt6.QtCore import QByteArray, QSettings, QSize, pyqtSlot
+from PyQt6.QtCore import QByteArray, QSettings, QSize, QTimer, pyqtSlot
 from PyQt6.QtGui import QAction, QCloseEvent, QKeySequence
 from PyQt6.QtWidgets import QMainWindow, QMessageBox, QTabWidget, QWidget
 from returns.pipeline import is_successful
+from sqlalchemy.orm import selectinload, undefer
 from sqlalchemy.sql.expression import select
 
 from mcr_analyzer.__about__ import __version__
 from mcr_analyzer.config.csv import CSV__FILENAME_EXTENSION
-from mcr_analyzer.config.netpbm import PGM__IMAGE__DATA_TYPE  # cSpell:ignore netpbm
 from mcr_analyzer.config.qt import (
     MAIN_WINDOW__SIZE_HINT,
+    Q_SETTINGS__SESSION__RECENT_FILE_NAME_LIST__MAX_LENGTH,
     q_settings__session__recent_file_name_list__get,
     q_settings__session__recent_file_name_list__remove,
 )
 from mcr_analyzer.database.database import database
-from mcr_analyzer.database.models import Measurement
+from mcr_analyzer.database.models import Group, Measurement
+from mcr_analyzer.io.image import image_data_from_bytes
 from mcr_analyzer.ui.graphics_scene import Grid
 from mcr_analyzer.ui.importer import ImportWidget
 from mcr_analyzer.ui.measurement import (
@@ -60,6 +61,8 @@ class MainWindow(QMainWindow):
         self.q_settings__restore()
 
     def closeEvent(self, event: QCloseEvent) -> None:  # noqa: N802, ARG002
+        self.import_widget.wait_for_threads()
+
         self.q_settings__save()
 
     def sizeHint(self) -> QSize:  # noqa: N802, PLR6301
@@ -89,6 +92,16 @@ class MainWindow(QMainWindow):
 
         self.menu_file__submenu_recent_files = menu.addMenu("Recent databases")
 
+        # - The actions are created once and only relabeled and shown or hidden when the list changes.
+        self.menu_file__submenu_recent_files__action_list: list[QAction] = []
+
+        for _ in range(Q_SETTINGS__SESSION__RECENT_FILE_NAME_LIST__MAX_LENGTH):
+            action = QAction(self.menu_file__submenu_recent_files)
+            action.setVisible(False)
+            action.triggered.connect(self.open_recent_file)
+            self.menu_file__submenu_recent_files.addAction(action)
+            self.menu_file__submenu_recent_files__action_list.append(action)
+
         menu.addSeparator()
 
         action_quit = QAction("&Quit", self)
@@ -123,15 +136,16 @@ class MainWindow(QMainWindow):
 
     @pyqtSlot()
     def _refresh__menu_file__submenu_recent_files(self) -> None:
-        self.menu_file__submenu_recent_files.clear()
-
         recent_file_name_list = q_settings__session__recent_file_name_list__get()
 
-        for recent_file_name in recent_file_name_list:
-            action = QAction(recent_file_name, self.menu_file__submenu_recent_files)
-            action.setData(recent_file_name)
-            action.triggered.connect(self.open_recent_file)
-            self.menu_file__submenu_recent_files.addAction(action)
+        for i, action in enumerate(self.menu_file__submenu_recent_files__action_list):
+            if i < len(recent_file_name_list):
+                recent_file_name = recent_file_name_list[i]
+                action.setText(recent_file_name)
+                action.setData(recent_file_name)
+                action.setVisible(True)
+            else:
+                action.setVisible(False)
 
         self.menu_file__submenu_recent_files.setEnabled(not self.menu_file__submenu_recent_files.isEmpty())
 
@@ -202,16 +216,24 @@ class MainWindow(QMainWindow):
 
         if directory_path is not None:
             with database.Session() as session:
-                for measurement in session.execute(select(Measurement)).scalars():
+                # - The groups and spots of all measurements are loaded with one `SELECT ... IN` each, instead of two
+                #   queries per measurement when each grid is built.
+                measurements = session.execute(
+                    select(Measurement).options(
+                        undefer(Measurement.image_data), selectinload(Measurement.groups).selectinload(Group.spots)
+                    )
+                ).scalars()
+
+                for measurement in measurements:
                     image_data = measurement.image_data
                     image_height = measurement.image_height
                     image_width = measurement.image_width
 
                     file_path = directory_path.joinpath(measurement.chip_id).with_suffix(CSV__FILENAME_EXTENSION)
 
-                    image = (
-                        np.frombuffer(image_data, dtype=PGM__IMAGE__DATA_TYPE).reshape(image_height, image_width).copy()
-                    )  # cSpell:ignore frombuffer dtype
+                    image = image_data_from_bytes(
+                        image_bytes=image_data, image_height=image_height, image_width=image_width
+                    )
                     grid = Grid(session=session, measurement_id=measurement.id)
                     model = get_result_list_model_from_grid_group_info_dict(grid=grid, image_data=image)
 
@@ -238,6 +260,14 @@ class MainWindow(QMainWindow):
         if window_state is not None:
             self.restoreState(window_state)
 
+        # - Opening the most recent database and loading its measurement list is left to the event loop, so that the
+        #   window is shown and painted first.
+        QTimer.singleShot(0, self._q_settings__restore_recent_database)
+
+    @pyqtSlot()
+    def _q_settings__restore_recent_database(self) -> None:
+        q_settings = QSettings()
+
         recent_file_name_list = q_settings__session__recent_file_name_list__get()
 
         recent_file_name_not_found_list: list[str] = []
@@ -1,8 +1,12 @@
+import csv
+import math
+import os
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 import cv2 as cv
 import numpy as np
-import pandas as pd
+import numpy.typing as npt
 from PyQt6.QtCore import (
     QAbstractItemModel,
     QItemSelection,
@@ -34,42 +38,45 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 from returns.pipeline import is_successful
-from sqlalchemy.sql.expression import select
+from sqlalchemy.orm import undefer
+from sqlalchemy.sql.expression import select, update
 
 from mcr_analyzer.config.csv import CSV__FILE_FILTER, CSV__FILENAME_EXTENSION
 from mcr_analyzer.config.image import (
+    IMAGE__CACHE__MAX_LENGTH,
     OPEN_CV__IMAGE__BRIGHTNESS__MAX,
     OPEN_CV__IMAGE__BRIGHTNESS__MIN,
     OPEN_CV__IMAGE__ND_ARRAY__DATA_TYPE,
     CornerPositions,
     Position,
-    get_distance,
     get_grid,
     normalize_image,
 )
-from mcr_analyzer.config.netpbm import PGM__IMAGE__DATA_TYPE, PGM__IMAGE__ND_ARRAY__DATA_TYPE  # cSpell:ignore netpbm
 from mcr_analyzer.config.qt import q_color_with_alpha, set_button_color
 from mcr_analyzer.config.spot import SPOT__NUMBER__OF__BRIGHTEST_PIXELS
 from mcr_analyzer.database.database import database
-from mcr_analyzer.database.models import Group, Measurement, Spot
+from mcr_analyzer.database.models import Measurement
+from mcr_analyzer.io.image import image_data_from_bytes
 from mcr_analyzer.io.mcr_rslt import MCR_RSLT__DATE_TIME__FORMAT, McrRslt
-from mcr_analyzer.ui.graphics_items import GridCoordinates, GroupInfo, SpotItem, get_spots_position
+from mcr_analyzer.ui.graphics_items import GroupInfo, SpotItem
 from mcr_analyzer.ui.graphics_scene import Grid
 from mcr_analyzer.ui.graphics_view import GraphicsView
 from mcr_analyzer.ui.models import (
     MeasurementListModelColumnIndex,
     ResultListModelColumnIndex,
     ResultListModelColumnName,
+    add_groups,
     delete_groups,
     get_group_info_dict_from_database,
     get_measurement_list_model_from_database,
 )
-from mcr_analyzer.utils.number import clamp
 from mcr_analyzer.utils.q_file_dialog import FileDialog
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from mcr_analyzer.config.netpbm import PGM__IMAGE__ND_ARRAY__DATA_TYPE  # cSpell:ignore netpbm
+
 
 class MeasurementWidget(QWidget):
     def __init__(self, parent: QWidget | None = None) -> None:
@@ -81,6 +88,12 @@ class MeasurementWidget(QWidget):
         self.image_display: OPEN_CV__IMAGE__ND_ARRAY__DATA_TYPE | None = None
         self.grid: Grid | None = None
 
+        # - Image data of a measurement never changes after import, so reselecting a recently selected measurement
+        #   reuses its decoded and normalized images instead of loading and converting the image data again.
+        self._image_cache: OrderedDict[
+            int, tuple[PGM__IMAGE__ND_ARRAY__DATA_TYPE, OPEN_CV__IMAGE__ND_ARRAY__DATA_TYPE]
+        ] = OrderedDict()
+
         self.group_pattern_clipboard_measurement_id: int | None = None
 
         self._initialize_layout()
@@ -112,6 +125,7 @@ class MeasurementWidget(QWidget):
         self.measurement_list_view = QTreeView()
         self.measurement_list_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.measurement_list_view.setRootIsDecorated(False)
+        self.measurement_list_view.setUniformRowHeights(True)
         self.measurement_list_view.setAlternatingRowColors(True)
         self.measurement_list_view.header().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
         layout.addWidget(self.measurement_list_view)
@@ -316,6 +330,7 @@ class MeasurementWidget(QWidget):
         result_list_view = QTreeView()
         result_list_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         result_list_view.setRootIsDecorated(False)
+        result_list_view.setUniformRowHeights(True)
         result_list_view.header().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
 
         result_list_view.setSortingEnabled(True)
@@ -348,10 +363,12 @@ class MeasurementWidget(QWidget):
         if self.measurement_list_model is None:
             return
 
+        self._image_cache.clear()
         self.measurement_list_model.setSourceModel(get_measurement_list_model_from_database())
 
     @pyqtSlot()
     def update__measurement_list_view(self) -> None:
+        self._image_cache.clear()
         self.measurement_list_model = QSortFilterProxyModel()
 
         self.measurement_list_model.setSourceModel(get_measurement_list_model_from_database())
@@ -388,8 +405,14 @@ class MeasurementWidget(QWidget):
 
         self.measurement_id = measurement_id
 
+        image_cache_entry = self._image_cache.get(measurement_id)
+
+        statement = select(Measurement).where(Measurement.id == measurement_id)
+        if image_cache_entry is None:
+            statement = statement.options(undefer(Measurement.image_data))
+
         with database.Session() as session:
-            measurement = session.execute(select(Measurement).where(Measurement.id == measurement_id)).scalar_one()
+            measurement = session.execute(statement).scalar_one()
 
             self.device_id.setText(measurement.device_id)
             self.date_time.setText(measurement.date_time.strftime(MCR_RSLT__DATE_TIME__FORMAT))
@@ -401,20 +424,24 @@ class MeasurementWidget(QWidget):
             spot_size = measurement.spot_size
             self._update_fields_with_signal_blocked(column_count=column_count, row_count=row_count, spot_size=spot_size)
 
-            image_data = measurement.image_data
-            image_height = measurement.image_height
-            image_width = measurement.image_width
+            if image_cache_entry is None:
+                image = image_data_from_bytes(
+                    image_bytes=measurement.image_data,
+                    image_height=measurement.image_height,
+                    image_width=measurement.image_width,
+                )
+                image_cache_entry = image, normalize_image(image=image)
 
             self.notes.setPlainText(measurement.notes)
 
             grid = Grid(session=session, measurement_id=measurement_id)
 
-        image = (
-            np.frombuffer(image_data, dtype=PGM__IMAGE__DATA_TYPE).reshape(image_height, image_width).copy()
-        )  # cSpell:ignore frombuffer dtype
+        self._image_cache[measurement_id] = image_cache_entry
+        self._image_cache.move_to_end(measurement_id)
+        if len(self._image_cache) > IMAGE__CACHE__MAX_LENGTH:
+            self._image_cache.popitem(last=False)
 
-        self.image_original = image
-        self.image_display = normalize_image(image=image)
+        self.image_original, self.image_display = image_cache_entry
 
         self._set_image_display(image_display=self.image_display)
         self.image_brightness.setValue(0)
@@ -434,14 +461,19 @@ class MeasurementWidget(QWidget):
         self.scene.addItem(self.grid)
 
     def _set_image_display(self, *, image_display: OPEN_CV__IMAGE__ND_ARRAY__DATA_TYPE) -> None:
+        image_display = np.ascontiguousarray(image_display)  # cSpell:ignore ascontiguousarray
         image_height, image_width = image_display.shape
 
+        # - The image wraps the array buffer without a copy and is converted into the pixmap right away, while the array
+        #   is still alive. The stride is passed explicitly, because without it Qt expects each line to be padded to a
+        #   multiple of 4 bytes.
         self.pixmap.setPixmap(
             QPixmap(
                 QImage(
-                    image_display.tobytes(),  # cSpell:ignore tobytes
+                    image_display.data,
                     image_width,
                     image_height,
+                    image_display.strides[0],
                     QImage.Format.Format_Grayscale8,
                 )
             )
@@ -512,42 +544,33 @@ class MeasurementWidget(QWidget):
             return
 
         with database.Session() as session, session.begin():
-            measurement = session.execute(select(Measurement).where(Measurement.id == self.measurement_id)).scalar_one()
-
-            measurement.column_count = self.column_count.value()
-            measurement.row_count = self.row_count.value()
-
-            measurement.spot_size = self.spot_size.value()
-
-            measurement.spot_corner_top_left_x = self.grid.corner_spots.top_left.x()
-            measurement.spot_corner_top_left_y = self.grid.corner_spots.top_left.y()
-            measurement.spot_corner_top_right_x = self.grid.corner_spots.top_right.x()
-            measurement.spot_corner_top_right_y = self.grid.corner_spots.top_right.y()
-            measurement.spot_corner_bottom_right_x = self.grid.corner_spots.bottom_right.x()
-            measurement.spot_corner_bottom_right_y = self.grid.corner_spots.bottom_right.y()
-            measurement.spot_corner_bottom_left_x = self.grid.corner_spots.bottom_left.x()
-            measurement.spot_corner_bottom_left_y = self.grid.corner_spots.bottom_left.y()
-
-            measurement.notes = self.notes.toPlainText()
-
-            delete_groups(session=session, measurement_id=self.measurement_id)
-
-            for group_info_dict in self.grid.get_group_info_dict().values():
-                group_name = group_info_dict.name
-                group_notes = group_info_dict.notes
-                group_color = group_info_dict.color
-                spots_grid_coordinates = group_info_dict.spots_grid_coordinates
-
-                group = Group(
-                    measurement=measurement, name=group_name, notes=group_notes, color_code_hex_rgb=group_color.name()
+            # - One `UPDATE` instead of a `SELECT` of the measurement followed by a flush of its changed attributes.
+            session.execute(
+                update(Measurement)
+                .where(Measurement.id == self.measurement_id)
+                .values(
+                    column_count=self.column_count.value(),
+                    row_count=self.row_count.value(),
+                    spot_size=self.spot_size.value(),
+                    spot_corner_top_left_x=self.grid.corner_spots.top_left.x(),
+                    spot_corner_top_left_y=self.grid.corner_spots.top_left.y(),
+                    spot_corner_top_right_x=self.grid.corner_spots.top_right.x(),
+                    spot_corner_top_right_y=self.grid.corner_spots.top_right.y(),
+                    spot_corner_bottom_right_x=self.grid.corner_spots.bottom_right.x(),
+                    spot_corner_bottom_right_y=self.grid.corner_spots.bottom_right.y(),
+                    spot_corner_bottom_left_x=self.grid.corner_spots.bottom_left.x(),
+                    spot_corner_bottom_left_y=self.grid.corner_spots.bottom_left.y(),
+                    notes=self.notes.toPlainText(),
                 )
+            )
 
-                spot_list = [
-                    Spot(group=group, row=spot_grid_coordinates.row, column=spot_grid_coordinates.column)
-                    for spot_grid_coordinates in spots_grid_coordinates
-                ]
+            delete_groups(session=session, measurement_id=self.measurement_id)
 
-                session.add_all([group, *spot_list])
+            add_groups(
+                session=session,
+                measurement_id=self.measurement_id,
+                group_info_list=self.grid.get_group_info_dict().values(),
+            )
 
     @pyqtSlot()
     def _reset(self) -> None:
@@ -657,11 +680,14 @@ class MeasurementWidget(QWidget):
             QMessageBox.warning(self, "Group name already exists", "Please use a unique group name.")
             return
 
+        # - Collected once, instead of all groups being walked again for every selected spot.
+        grouped_spots_grid_coordinates = self.grid.get_grouped_spots_grid_coordinates()
+
         spots_grid_coordinates = [
             selected_item.grid_coordinates
             for selected_item in self.scene.selectedItems()
             if isinstance(selected_item, SpotItem)
-            and not self.grid.is_grouped(spot_grid_coordinates=selected_item.grid_coordinates)
+            and selected_item.grid_coordinates not in grouped_spots_grid_coordinates
         ]
 
         self.grid.group_info_dict_add(
@@ -795,49 +821,140 @@ def _change_image_brightness(
     return cv.convertScaleAbs(src=input_image, beta=brightness)
 
 
-def _get_spot_data_list(
+def _get_spots_mean_brightest(
+    *,
+    spot_size: float,
+    image_data: "PGM__IMAGE__ND_ARRAY__DATA_TYPE",
+    row_count: int,
+    column_count: int,
+    corner_positions: CornerPositions,
+) -> list[list[float]]:
+    """Get the mean of the brightest pixels of each spot by row and column, or `NaN` for a spot without pixels.
+
+    All spots are reduced together instead of one spot at a time.
+    """
+    center_x, center_y = _get_spots_center(
+        row_count=row_count, column_count=column_count, corner_positions=corner_positions
+    )
+
+    spots_data = _get_spots_data(
+        spot_size=spot_size, image_data=image_data, center_x=center_x.ravel(), center_y=center_y.ravel()
+    )
+
+    spots_mean_brightest: list[list[float]] = _get_mean_brightest(spots_data).reshape(row_count, column_count).tolist()
+
+    return spots_mean_brightest
+
+
+def _get_spots_center(
+    *, row_count: int, column_count: int, corner_positions: CornerPositions
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Get the `x` and `y` of the center of each spot by row and column.
+
+    The same interpolation between the corners as `get_items_position`, but on arrays instead of one `Position` per
+    spot.
+    """
+    rows = np.arange(row_count)[:, np.newaxis]
+    columns = np.arange(column_count)[np.newaxis, :]
+
+    def interpolate(
+        top_left: float, top_right: float, bottom_right: float, bottom_left: float
+    ) -> npt.NDArray[np.float64]:
+        row_i_left: npt.NDArray[np.float64] = top_left + (bottom_left - top_left) * rows / (row_count - 1)
+        row_i_right: npt.NDArray[np.float64] = top_right + (bottom_right - top_right) * rows / (row_count - 1)
+
+        row_i_column_j: npt.NDArray[np.float64] = row_i_left + (row_i_right - row_i_left) * columns / (column_count - 1)
+
+        return row_i_column_j
+
+    top_left = corner_positions.top_left
+    top_right = corner_positions.top_right
+    bottom_right = corner_positions.bottom_right
+    bottom_left = corner_positions.bottom_left
+
+    return (
+        interpolate(top_left.x(), top_right.x(), bottom_right.x(), bottom_left.x()),
+        interpolate(top_left.y(), top_right.y(), bottom_right.y(), bottom_left.y()),
+    )
+
+
+def _get_spots_data(
     *,
     spot_size: float,
-    image_data: PGM__IMAGE__ND_ARRAY__DATA_TYPE,
-    spots_position: dict[GridCoordinates, Position],
-    spots_grid_coordinates: list[GridCoordinates],
-) -> list[PGM__IMAGE__ND_ARRAY__DATA_TYPE]:
+    image_data: "PGM__IMAGE__ND_ARRAY__DATA_TYPE",
+    center_x: npt.NDArray[np.float64],
+    center_y: npt.NDArray[np.float64],
+) -> npt.NDArray[np.int32]:
+    """Get the pixels of the bounding square of each spot as one row, with `-1` for pixels outside of the spot."""
     image_height, image_width = image_data.shape
 
-    image_height_min = 0.0
-    image_height_max = image_height - 1
-    image_width_min = 0.0
-    image_width_max = image_width - 1
+    spots_count = len(center_x)
+
+    center_x = center_x[:, np.newaxis, np.newaxis]
+    center_y = center_y[:, np.newaxis, np.newaxis]
+
+    left = np.round(center_x - spot_size / 2)
+    top = np.round(center_y - spot_size / 2)
+
+    right = np.round(np.clip(left + spot_size, 0, image_width - 1)).astype(np.intp)
+    bottom = np.round(np.clip(top + spot_size, 0, image_height - 1)).astype(np.intp)
+
+    left = np.round(np.clip(left, 0, image_width - 1)).astype(np.intp)
+    top = np.round(np.clip(top, 0, image_height - 1)).astype(np.intp)
+
+    square_height = int(np.max(bottom - top, initial=0))
+    square_width = int(np.max(right - left, initial=0))
+
+    # - The pixel indexes of the bounding squares as (spots, rows, 1) and (spots, 1, columns) arrays, which broadcast to
+    #   the distance of every pixel in a square to its spot center.
+    rows = top + np.arange(square_height)[:, np.newaxis]
+    columns = left + np.arange(square_width)[np.newaxis, :]
+
+    is_inside_spot = (
+        (rows < bottom) & (columns < right) & (np.hypot(columns - center_x, rows - center_y) <= spot_size / 2)
+    )
 
-    spot_data_list = []
-    for spot_grid_coordinates in spots_grid_coordinates:
-        spot_position = spots_position[spot_grid_coordinates]
+    spots_data: npt.NDArray[np.int32] = image_data[
+        np.minimum(rows, image_height - 1), np.minimum(columns, image_width - 1)
+    ].astype(np.int32)
+    spots_data[~is_inside_spot] = -1
 
-        center_x = spot_position.x()
-        center_y = spot_position.y()
+    return spots_data.reshape(spots_count, square_height * square_width)
 
-        left = round(center_x - spot_size / 2)
-        top = round(center_y - spot_size / 2)
 
-        right = left + spot_size
-        bottom = top + spot_size
+def _get_mean_brightest(spots_data: npt.NDArray[np.int32]) -> npt.NDArray[np.float64]:
+    spots_count, pixel_count = spots_data.shape
 
-        top = round(clamp(x=top, lower_bound=image_height_min, upper_bound=image_height_max))
-        bottom = round(clamp(x=bottom, lower_bound=image_height_min, upper_bound=image_height_max))
+    brightest_pixel_count = min(SPOT__NUMBER__OF__BRIGHTEST_PIXELS, pixel_count)
+    if brightest_pixel_count == 0:
+        return np.full(spots_count, np.nan)
 
-        left = round(clamp(x=left, lower_bound=image_width_min, upper_bound=image_width_max))
-        right = round(clamp(x=right, lower_bound=image_width_min, upper_bound=image_width_max))
+    # - Only the brightest pixels are needed, so a partition in linear time replaces a full sort. Pixels outside of a
+    #   spot are negative, so they are only among the brightest pixels of spots with fewer pixels than needed.
+    spots_data_brightest = np.partition(spots_data, -brightest_pixel_count, axis=1)[:, -brightest_pixel_count:]
+    spots_data_brightest_is_inside_spot = spots_data_brightest >= 0
 
-        spot_data = np.array([
-            image_data[row, column]
-            for row in range(top, bottom)
-            for column in range(left, right)
-            if get_distance(spot_position, Position(column, row)) <= spot_size / 2
-        ])
+    return np.divide(
+        np.sum(spots_data_brightest, axis=1, where=spots_data_brightest_is_inside_spot, dtype=np.int64),
+        np.count_nonzero(spots_data_brightest_is_inside_spot, axis=1),
+        out=np.full(spots_count, np.nan),
+        where=np.any(spots_data_brightest_is_inside_spot, axis=1),
+    )
 
-        spot_data_list.append(spot_data)
 
-    return spot_data_list
+def _get_result_mean_and_standard_deviation(spots_mean_brightest: list[float]) -> tuple[float, float]:
+    values = [value for value in spots_mean_brightest if not math.isnan(value)]
+    count = len(values)
+
+    if count == 0:
+        return np.nan, np.nan
+
+    # - A group has only a handful of spots, for which plain float arithmetic is cheaper than creating arrays and
+    #   dispatching `np.mean` and `np.std`.
+    mean = math.fsum(values) / count
+    standard_deviation = math.sqrt(math.fsum((value - mean) ** 2 for value in values) / count)
+
+    return round(mean), round(standard_deviation)
 
 
 def _get_regular_expression(pattern: str) -> QRegularExpression:
@@ -847,7 +964,7 @@ def _get_regular_expression(pattern: str) -> QRegularExpression:
 
 
 def get_result_list_model_from_grid_group_info_dict(
-    *, grid: Grid | None, image_data: PGM__IMAGE__ND_ARRAY__DATA_TYPE | None
+    *, grid: Grid | None, image_data: "PGM__IMAGE__ND_ARRAY__DATA_TYPE | None"
 ) -> QStandardItemModel:
     model = QStandardItemModel()
     model.setHorizontalHeaderLabels([column_name.value.display for column_name in ResultListModelColumnName])
@@ -857,8 +974,12 @@ def get_result_list_model_from_grid_group_info_dict(
         row_count = grid.get_row_count()
         column_count = grid.get_column_count()
 
-        spots_position = get_spots_position(
-            row_count=row_count, column_count=column_count, corner_positions=grid.get_corner_positions()
+        spots_mean_brightest = _get_spots_mean_brightest(
+            spot_size=spot_size,
+            image_data=image_data,
+            row_count=row_count,
+            column_count=column_count,
+            corner_positions=grid.get_corner_positions(),
         )
 
         for group_info_dict in grid.get_group_info_dict().values():
@@ -867,28 +988,12 @@ def get_result_list_model_from_grid_group_info_dict(
             group_color = group_info_dict.color
             spots_grid_coordinates = group_info_dict.spots_grid_coordinates
 
-            spot_data_list = _get_spot_data_list(
-                spot_size=spot_size,
-                image_data=image_data,
-                spots_position=spots_position,
-                spots_grid_coordinates=spots_grid_coordinates,
-            )
-
-            spot_data_mean_brightest_list = [
-                np.mean(spot_data_sorted[-SPOT__NUMBER__OF__BRIGHTEST_PIXELS:])
-                for spot_data_sorted in [np.sort(spot_data, axis=None) for spot_data in spot_data_list]
-                if len(spot_data_sorted) > 0
-            ]
-
             result_count = len(spots_grid_coordinates)
 
-            if len(spot_data_mean_brightest_list) == 0:
-                result_mean = np.nan
-                result_standard_deviation = np.nan
-
-            else:
-                result_mean = round(np.mean(spot_data_mean_brightest_list))
-                result_standard_deviation = round(np.std(spot_data_mean_brightest_list))
+            result_mean, result_standard_deviation = _get_result_mean_and_standard_deviation([
+                spots_mean_brightest[spot_grid_coordinates.row][spot_grid_coordinates.column]
+                for spot_grid_coordinates in spots_grid_coordinates
+            ])
 
             row_items = [
                 QStandardItem(str(x))
@@ -906,11 +1011,13 @@ def get_result_list_model_from_grid_group_info_dict(
 def result_list_model_to_csv(*, file_path: "Path", result_list_model: QAbstractItemModel) -> None:
     model = result_list_model
 
-    data = [
-        [model.data(model.index(row, column)) for column in range(model.columnCount())]
-        for row in range(model.rowCount())
-    ]
-
     columns = [column_name.value.display for column_name in ResultListModelColumnName]
 
-    pd.DataFrame(data=data, columns=columns).to_csv(file_path, index=False)
+    # - The rows are written to the file as they are read from the model, without building an intermediate table.
+    with file_path.open("w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file, lineterminator=os.linesep)
+        writer.writerow(columns)
+        writer.writerows(
+            [model.data(model.index(row, column)) for column in range(model.columnCount())]
+            for row in range(model.rowCount())
+        )
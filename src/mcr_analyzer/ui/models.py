@@ -2,7 +2,8 @@ from enum import Enum, auto
 from typing import TYPE_CHECKING
 
 from PyQt6.QtGui import QColor, QStandardItem, QStandardItemModel
-from sqlalchemy.sql.expression import delete, select
+from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.expression import delete, insert, select
 
 from mcr_analyzer.database.database import database
 from mcr_analyzer.database.models import Group, Measurement, Spot
@@ -10,6 +11,8 @@ from mcr_analyzer.io.mcr_rslt import MCR_RSLT__DATE_TIME__FORMAT, McrRslt, Name
 from mcr_analyzer.ui.graphics_items import GridCoordinates, GroupInfo
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from sqlalchemy.orm import Session
 
 
@@ -32,7 +35,11 @@ def get_measurement_list_model_from_database() -> QStandardItemModel:
     ])
 
     with database.Session() as session:
-        measurements = session.execute(select(Measurement)).scalars()
+        # - Only the listed columns are selected, as plain rows: no other column is read and no ORM instance is built
+        #   and tracked per measurement.
+        measurements = session.execute(
+            select(Measurement.id, Measurement.date_time, Measurement.chip_id, Measurement.probe_id)
+        )
 
         for measurement in measurements:
             model.appendRow([
@@ -63,32 +70,58 @@ class ResultListModelColumnName(Enum):
 
 
 def get_group_info_dict_from_database(*, session: "Session", measurement_id: int) -> dict[str, GroupInfo]:
+    groups = session.execute(
+        select(Group).where(Group.measurement_id == measurement_id).options(selectinload(Group.spots))
+    ).scalars()
+
+    return get_group_info_dict_from_groups(groups)
+
+
+def get_group_info_dict_from_groups(groups: "Iterable[Group]") -> dict[str, GroupInfo]:
     return {
-        group_name: GroupInfo(
-            name=group_name,
-            notes=group_notes,
-            color=group_color,
-            spots_grid_coordinates=[
-                GridCoordinates(row=spot.row, column=spot.column)
-                for spot in session.execute(select(Spot).where(Spot.group_id == group_id)).scalars()
-            ],
-        )
-        for group_id, group_name, group_notes, group_color in _database_session_get_groups(
-            session=session, measurement_id=measurement_id
+        group.name: GroupInfo(
+            name=group.name,
+            notes=group.notes,
+            color=QColor(group.color_code_hex_rgb),
+            spots_grid_coordinates=[GridCoordinates(row=spot.row, column=spot.column) for spot in group.spots],
         )
+        for group in groups
     }
 
 
-def _database_session_get_groups(*, session: "Session", measurement_id: int) -> list[tuple[int, str, str, QColor]]:
-    groups = session.execute(select(Group).where(Group.measurement_id == measurement_id)).scalars()
+def delete_groups(*, session: "Session", measurement_id: int) -> None:
+    group_id_list = select(Group.id).where(Group.measurement_id == measurement_id)
 
-    return [(group.id, group.name, group.notes, QColor(group.color_code_hex_rgb)) for group in groups]
+    session.execute(delete(Spot).where(Spot.group_id.in_(group_id_list)))
 
+    session.execute(delete(Group).where(Group.measurement_id == measurement_id))
 
-def delete_groups(*, session: "Session", measurement_id: int) -> None:
-    for group_id, _group_name, _group_notes, _group_color in _database_session_get_groups(
-        session=session, measurement_id=measurement_id
-    ):
-        session.execute(delete(Spot).where(Spot.group_id == group_id))
 
-    session.execute(delete(Group).where(Group.measurement_id == measurement_id))
+def add_groups(*, session: "Session", measurement_id: int, group_info_list: "Iterable[GroupInfo]") -> None:
+    group_info_list = list(group_info_list)
+
+    if len(group_info_list) == 0:
+        return
+
+    # - Bulk inserts bypass the unit of work: one statement for all groups and one `executemany` for all spots.
+    group_id_list = session.scalars(
+        insert(Group).returning(Group.id, sort_by_parameter_order=True),
+        [
+            {
+                "measurement_id": measurement_id,
+                "name": group_info.name,
+                "notes": group_info.notes,
+                "color_code_hex_rgb": group_info.color.name(),
+            }
+            for group_info in group_info_list
+        ],
+    ).all()
+
+    spot_list = [
+        {"group_id": group_id, "row": spot_grid_coordinates.row, "column": spot_grid_coordinates.column}
+        for group_id, group_info in zip(group_id_list, group_info_list, strict=True)
+        for spot_grid_coordinates in group_info.spots_grid_coordinates
+    ]
+
+    if len(spot_list) > 0:
+        session.execute(insert(Spot), spot_list)
@@ -1,15 +1,14 @@
-from typing import TYPE_CHECKING
+from typing import IO, TYPE_CHECKING, AnyStr
 
 if TYPE_CHECKING:
     from collections.abc import Generator
-    from io import TextIOWrapper
 
 
-def readline_skip(file: "TextIOWrapper", n: int = 1) -> None:
+def readline_skip(file: IO[AnyStr], n: int = 1) -> None:
     for _ in range(n):
         next(file)
 
 
-def readlines(file: "TextIOWrapper", n: int = 1) -> "Generator[str, None, None]":
+def readlines(file: IO[AnyStr], n: int = 1) -> "Generator[AnyStr, None, None]":
     for _ in range(n):
         yield file.readline()
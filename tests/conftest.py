@@ -3,11 +3,39 @@ from typing import TYPE_CHECKING
 import pytest
 
 from mcr_analyzer.config.database import SQLITE__FILENAME_EXTENSION
+from mcr_analyzer.database.database import create_engine__sqlite, database
+from mcr_analyzer.database.models import Base, Measurement
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
     from pathlib import Path
 
 
+@pytest.fixture()
+def _database_strict_loading() -> "Generator[None, None, None]":
+    database.enable_strict_loading()
+
+    yield
+
+    database.disable_strict_loading()
+
+
 @pytest.fixture()
 def tmp_sqlite_file_path(tmp_path: "Path") -> "Path":
     return tmp_path.joinpath(f"tmp{SQLITE__FILENAME_EXTENSION}")
+
+
+@pytest.fixture()
+def tmp_sqlite_file_path__without_image_hash_index(tmp_sqlite_file_path: "Path") -> "Path":
+    """A database as created before `Measurement.image_hash` had a unique index."""
+    engine = create_engine__sqlite(tmp_sqlite_file_path)
+
+    Base.metadata.create_all(bind=engine)
+
+    for index in Base.metadata.tables[Measurement.__tablename__].indexes:
+        if index.unique:
+            index.drop(bind=engine)
+
+    engine.dispose()
+
+    return tmp_sqlite_file_path
@@ -1,7 +1,20 @@
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
+import pytest
+from returns.pipeline import is_successful
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import QueuePool, StaticPool
+from sqlalchemy.sql.expression import select
+from sqlalchemy.types import Integer
+
 from mcr_analyzer.config.database import SQLITE__DRIVER_NAME
-from mcr_analyzer.database.database import create_engine__sqlite, make_url__sqlite
+from mcr_analyzer.config.hash import HASH__DIGEST_SIZE
+from mcr_analyzer.database.database import create_engine__sqlite, database, make_url__sqlite
+from mcr_analyzer.database.models import Group, Measurement, Spot
+from mcr_analyzer.ui.models import get_group_info_dict_from_database
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -19,7 +32,109 @@ def test___database__create_engine__sqlite(tmp_sqlite_file_path: "Path") -> None
     engine = create_engine__sqlite()
 
     assert str(engine) == f"Engine({_url__sqlite__in_memory})"
+    assert isinstance(engine.pool, StaticPool)
 
     engine = create_engine__sqlite(tmp_sqlite_file_path)
 
     assert str(engine) == f"Engine({_url__sqlite__in_memory}/{tmp_sqlite_file_path})"
+    assert isinstance(engine.pool, QueuePool)
+
+
+def test___database__create_engine__sqlite__pragma(tmp_sqlite_file_path: "Path") -> None:
+    engine = create_engine__sqlite(tmp_sqlite_file_path)
+
+    with engine.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar_one() == "wal"
+
+    engine.dispose()
+
+
+def _get_measurement() -> Measurement:
+    return Measurement(
+        date_time=datetime.now(tz=UTC),
+        device_id="",
+        probe_id="",
+        chip_id="",
+        image_data=b"",
+        image_height=0,
+        image_width=0,
+        image_hash=bytes(HASH__DIGEST_SIZE),
+        row_count=1,
+        column_count=1,
+        spot_size=1,
+        spot_corner_top_left_x=0,
+        spot_corner_top_left_y=0,
+        spot_corner_top_right_x=0,
+        spot_corner_top_right_y=0,
+        spot_corner_bottom_right_x=0,
+        spot_corner_bottom_right_y=0,
+        spot_corner_bottom_left_x=0,
+        spot_corner_bottom_left_y=0,
+        notes="",
+    )
+
+
+@pytest.mark.usefixtures("_database_strict_loading")
+def test___database__strict_loading() -> None:
+    database.create_and_load__sqlite()
+
+    with database.Session() as session, session.begin():
+        measurement = _get_measurement()
+        group = Group(measurement=measurement, name="group", notes="", color_code_hex_rgb="#000000")
+        session.add_all([measurement, group, Spot(group=group, row=0, column=0)])
+
+    with database.Session() as session:
+        measurement = session.execute(select(Measurement)).scalar_one()
+
+        with pytest.raises(InvalidRequestError):
+            _ = measurement.groups
+
+        group_info_dict = get_group_info_dict_from_database(session=session, measurement_id=measurement.id)
+
+    assert len(group_info_dict["group"].spots_grid_coordinates) == 1
+
+
+def test___database__measurement__primary_key() -> None:
+    # - An integer primary key is an alias of the SQLite rowid, which keeps the table and the foreign keys referencing
+    #   it narrow, while the wide image hash only lives in its own unique index.
+    table = Measurement.__table__
+
+    assert [column.name for column in table.primary_key] == ["id"]
+    assert isinstance(table.c.id.type, Integer)
+    assert table.c.image_hash.unique
+
+
+def test___database__measurement__image_data_is_last_column() -> None:
+    # - The integer primary key is the rowid, which is not read from the record.
+    column_name_list = [column.name for column in Measurement.__table__.columns if not column.primary_key]
+
+    assert column_name_list[-1] == Measurement.image_data.key
+
+
+def test___database__load__sqlite__without_image_hash_index(
+    tmp_sqlite_file_path__without_image_hash_index: "Path",
+) -> None:
+    load_result = database.load__sqlite(tmp_sqlite_file_path__without_image_hash_index)
+
+    assert is_successful(load_result), load_result.failure()
+
+    index_list = inspect(load_result.unwrap()).get_indexes(Measurement.__tablename__)
+
+    database.close()
+
+    assert {"column_names": [Measurement.image_hash.key], "unique": 1} in [
+        {"column_names": index["column_names"], "unique": index["unique"]} for index in index_list
+    ]
+
+
+def test___database__load__sqlite__without_image_hash_index__duplicate_image_hash(
+    tmp_sqlite_file_path__without_image_hash_index: "Path",
+) -> None:
+    engine = create_engine__sqlite(tmp_sqlite_file_path__without_image_hash_index)
+
+    with Session(bind=engine) as session, session.begin():
+        session.add_all([_get_measurement(), _get_measurement()])
+
+    engine.dispose()
+
+    assert not is_successful(database.load__sqlite(tmp_sqlite_file_path__without_image_hash_index))
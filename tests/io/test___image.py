@@ -0,0 +1,62 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+from returns.pipeline import is_successful
+
+from mcr_analyzer.config.netpbm import (  # cSpell:ignore netpbm
+    PGM__COLOR_RANGE_MAX,
+    PGM__HEIGHT,
+    PGM__IMAGE__BINARY_RAW__DATA_TYPE,
+    PGM__IMAGE__DATA_TYPE,
+    PGM__IMAGE__ND_ARRAY__DATA_TYPE,
+    PGM__SHAPE,
+    PGM__WIDTH,
+)
+from mcr_analyzer.io.image import parse_image
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _generate_image() -> PGM__IMAGE__ND_ARRAY__DATA_TYPE:
+    return np.arange(PGM__HEIGHT * PGM__WIDTH, dtype=PGM__IMAGE__DATA_TYPE).reshape(PGM__SHAPE)
+
+
+def _pgm_header(netpbm_magic_number: str) -> bytes:
+    return f"{netpbm_magic_number}\n{PGM__WIDTH} {PGM__HEIGHT}\n{PGM__COLOR_RANGE_MAX}\n".encode("ascii")
+
+
+def test___io__image__parse_image__ascii_plain(tmp_path: "Path") -> None:
+    image = _generate_image()
+
+    file_path = tmp_path.joinpath("tmp.pgm")
+    file_path.write_bytes(
+        _pgm_header("P2") + "\n".join(" ".join(map(str, row)) for row in image.tolist()).encode("ascii")
+    )
+
+    image_result = parse_image(file_path=file_path)
+
+    assert is_successful(image_result), image_result.failure()
+
+    image_data, image_height, image_width = image_result.unwrap()
+
+    assert (image_height, image_width) == PGM__SHAPE
+    assert np.array_equal(image_data, image)
+
+
+def test___io__image__parse_image__binary_raw(tmp_path: "Path") -> None:
+    image = _generate_image()
+
+    file_path = tmp_path.joinpath("tmp.pgm")
+    file_path.write_bytes(_pgm_header("P5") + image.astype(PGM__IMAGE__BINARY_RAW__DATA_TYPE).tobytes())
+
+    image_result = parse_image(file_path=file_path)
+
+    assert is_successful(image_result), image_result.failure()
+
+    image_data, image_height, image_width = image_result.unwrap()
+
+    assert (image_height, image_width) == PGM__SHAPE
+    assert np.array_equal(image_data, image)
+    assert image_data.dtype == np.dtype(PGM__IMAGE__DATA_TYPE)
+    assert image_data.dtype.isnative  # cSpell:ignore isnative
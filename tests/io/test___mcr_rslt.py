@@ -0,0 +1,84 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from mcr_analyzer.config.image import Position
+from mcr_analyzer.io.mcr_rslt import parse_mcr_rslt_in_directory_recursively
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+ROW_COUNT = 3
+COLUMN_COUNT = 4
+SPOT_SIZE = 10
+IMAGE_PGM_FILE_NAME = "result.pgm"
+
+
+def _write_mcr_rslt(directory_path: "Path", *, column_count: int = COLUMN_COUNT) -> None:
+    row_names = [chr(ord("A") + row) for row in range(ROW_COUNT)]
+    header_row = " ".join(["Nr", *map(str, range(1, column_count + 1))])
+
+    lines = [
+        "Date/time: 2024-04-01 10:00",
+        "Device ID: device",
+        "Probe ID: probe",
+        "Chip ID: chip",
+        f"Result image PGM: {IMAGE_PGM_FILE_NAME}",
+        "Result image PNG: result.png",
+        "Dark frame image PGM: dark.pgm",
+        "Temperature ok: yes",
+        "Clean image: yes",
+        "Thresholds: 1",
+        "",
+        f"X: {COLUMN_COUNT}",
+        f"Y: {ROW_COUNT}",
+        "Results:",
+        header_row,
+        *(
+            " ".join([row_name, *(str(100 * row + column) for column in range(column_count))])
+            for row, row_name in enumerate(row_names)
+        ),
+        "",
+        "Spots:",
+        f"Spot size: {SPOT_SIZE}",
+        header_row,
+        *(
+            " ".join([row_name, *(f"X={20 * column}Y={20 * row}" for column in range(column_count))])
+            for row, row_name in enumerate(row_names)
+        ),
+        "",
+    ]
+
+    directory_path.joinpath("result.rslt").write_text("\n".join(lines), encoding="utf-8")
+    directory_path.joinpath(IMAGE_PGM_FILE_NAME).touch()
+
+
+def test___io__mcr_rslt__parse_mcr_rslt_in_directory_recursively(tmp_path: "Path") -> None:
+    _write_mcr_rslt(tmp_path)
+
+    mcr_rslt_list, mcr_rslt_file_name_parse_fail_list = parse_mcr_rslt_in_directory_recursively(tmp_path)
+
+    assert mcr_rslt_file_name_parse_fail_list == []
+    assert len(mcr_rslt_list) == 1
+
+    mcr_rslt = mcr_rslt_list[0]
+
+    assert (mcr_rslt.row_count, mcr_rslt.column_count, mcr_rslt.spot_size) == (ROW_COUNT, COLUMN_COUNT, SPOT_SIZE)
+    assert np.array_equal(
+        mcr_rslt.results, [[100 * row + column for column in range(COLUMN_COUNT)] for row in range(ROW_COUNT)]
+    )
+    assert np.array_equal(
+        mcr_rslt.spots, [[[20 * column, 20 * row] for column in range(COLUMN_COUNT)] for row in range(ROW_COUNT)]
+    )
+    assert mcr_rslt.corner_positions.bottom_right == Position(
+        20 * (COLUMN_COUNT - 1) + SPOT_SIZE / 2, 20 * (ROW_COUNT - 1) + SPOT_SIZE / 2
+    )
+
+
+def test___io__mcr_rslt__parse_mcr_rslt_in_directory_recursively__column_count_mismatch(tmp_path: "Path") -> None:
+    _write_mcr_rslt(tmp_path, column_count=COLUMN_COUNT + 1)
+
+    mcr_rslt_list, mcr_rslt_file_name_parse_fail_list = parse_mcr_rslt_in_directory_recursively(tmp_path)
+
+    assert mcr_rslt_list == []
+    assert mcr_rslt_file_name_parse_fail_list == ["result.rslt"]
@@ -0,0 +1,114 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+from returns.pipeline import is_successful
+from sqlalchemy import func
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import select
+
+from mcr_analyzer.config.importer import (
+    IMPORTER__STATUS__IMPORT_FAILED,
+    IMPORTER__STATUS__IMPORT_SUCCESSFUL,
+    IMPORTER__STATUS__IMPORTED_PREVIOUSLY,
+)
+from mcr_analyzer.config.netpbm import (  # cSpell:ignore netpbm
+    PGM__COLOR_RANGE_MAX,
+    PGM__HEIGHT,
+    PGM__IMAGE__BINARY_RAW__DATA_TYPE,
+    PGM__SHAPE,
+    PGM__WIDTH,
+)
+from mcr_analyzer.database.database import database
+from mcr_analyzer.database.models import Measurement
+from mcr_analyzer.io.mcr_rslt import McrRslt, parse_mcr_rslt_in_directory_recursively
+from mcr_analyzer.ui.importer import _ImportWorker  # noqa: PLC2701
+from tests.io.test___mcr_rslt import IMAGE_PGM_FILE_NAME, _write_mcr_rslt
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+def _get_mcr_rslt_list(directory_path: "Path") -> list[McrRslt]:
+    _write_mcr_rslt(directory_path)
+    directory_path.joinpath(IMAGE_PGM_FILE_NAME).write_bytes(
+        f"P5\n{PGM__WIDTH} {PGM__HEIGHT}\n{PGM__COLOR_RANGE_MAX}\n".encode("ascii")
+        + np.zeros(PGM__SHAPE, dtype=PGM__IMAGE__BINARY_RAW__DATA_TYPE).tobytes()
+    )
+
+    mcr_rslt_list, _mcr_rslt_file_name_parse_fail_list = parse_mcr_rslt_in_directory_recursively(directory_path)
+
+    return mcr_rslt_list
+
+
+def _import(mcr_rslt_list: list[McrRslt]) -> tuple[int, list[str]]:
+    status_list: list[tuple[int, str]] = []
+
+    import_worker = _ImportWorker(mcr_rslt_list=mcr_rslt_list)
+    import_worker.measurement_imported.connect(lambda i, text, _icon_pixmap: status_list.append((i, text)))
+    import_worker.run()
+
+    with database.Session() as session:
+        measurement_count = session.execute(select(func.count()).select_from(Measurement)).scalar_one()
+
+    database.close()
+
+    return measurement_count, [text for _i, text in sorted(status_list)]
+
+
+def test___ui__importer__import_worker__same_image_twice(
+    tmp_path: "Path", tmp_sqlite_file_path__without_image_hash_index: "Path"
+) -> None:
+    directory_path = tmp_path.joinpath("measurement")
+    directory_path.mkdir()
+
+    mcr_rslt_list = _get_mcr_rslt_list(directory_path)
+
+    load_result = database.load__sqlite(tmp_sqlite_file_path__without_image_hash_index)
+
+    assert is_successful(load_result), load_result.failure()
+
+    assert _import(mcr_rslt_list * 2) == (
+        1,
+        [IMPORTER__STATUS__IMPORT_SUCCESSFUL, IMPORTER__STATUS__IMPORTED_PREVIOUSLY],
+    )
+
+
+def test___ui__importer__import_worker__commit_failed(
+    tmp_path: "Path", tmp_sqlite_file_path: "Path", monkeypatch: "pytest.MonkeyPatch"
+) -> None:
+    directory_path = tmp_path.joinpath("measurement")
+    directory_path.mkdir()
+
+    mcr_rslt_list = _get_mcr_rslt_list(directory_path)
+
+    database.create_and_load__sqlite(tmp_sqlite_file_path)
+
+    def commit(_session: Session) -> None:
+        raise OperationalError(statement="COMMIT", params=None, orig=Exception())
+
+    monkeypatch.setattr(Session, "commit", commit)
+
+    # - Measurements written before the failed commit must not be reported as imported.
+    assert _import(mcr_rslt_list) == (0, [IMPORTER__STATUS__IMPORT_FAILED])
+
+
+def test___ui__importer__import_worker__same_image_twice__commit_failed(
+    tmp_path: "Path", tmp_sqlite_file_path: "Path", monkeypatch: "pytest.MonkeyPatch"
+) -> None:
+    directory_path = tmp_path.joinpath("measurement")
+    directory_path.mkdir()
+
+    mcr_rslt_list = _get_mcr_rslt_list(directory_path)
+
+    database.create_and_load__sqlite(tmp_sqlite_file_path)
+
+    def commit(_session: Session) -> None:
+        raise OperationalError(statement="COMMIT", params=None, orig=Exception())
+
+    monkeypatch.setattr(Session, "commit", commit)
+
+    # - The second image was only skipped because of the first one, which was rolled back with its batch.
+    assert _import(mcr_rslt_list * 2) == (0, [IMPORTER__STATUS__IMPORT_FAILED, IMPORTER__STATUS__IMPORT_FAILED])